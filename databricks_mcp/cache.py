@@ -0,0 +1,206 @@
+"""Short-lived response cache for read-only Databricks tools."""
+
+from __future__ import annotations
+
+import functools
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from databricks_mcp.utils import ErrorMessage, from_json
+
+_READ_ONLY_PREFIXES = ("databricks_get_", "databricks_list_")
+
+# Side-effect-free reads without a get_/list_ name; cached like those
+_CACHED_READ_TOOLS = frozenset({
+    "databricks_current_metastore",
+    "databricks_dbfs_get_status",
+    "databricks_dbfs_list",
+    "databricks_files_get_metadata",
+    "databricks_files_list_directory",
+    "databricks_metastore_summary",
+    "databricks_search_experiments",
+    "databricks_tool_guide",
+})
+
+# Reads whose answer is expected to change between calls: status tools the
+# other tools tell agents to poll, run and event histories, file downloads
+# and model queries. Never cached, and running them does not invalidate.
+_UNCACHED_READ_TOOLS = frozenset({
+    "databricks_command_status",
+    "databricks_dbfs_download",
+    "databricks_export_notebook",
+    "databricks_export_run",
+    "databricks_files_download",
+    "databricks_genie_get_message",
+    "databricks_genie_get_message_query_result",
+    "databricks_get_app",
+    "databricks_get_app_deployment",
+    "databricks_get_cluster",
+    "databricks_get_database_instance",
+    "databricks_get_online_table",
+    "databricks_get_pipeline",
+    "databricks_get_quality_monitor_refresh",
+    "databricks_get_run",
+    "databricks_get_run_output",
+    "databricks_get_serving_endpoint",
+    "databricks_get_serving_endpoint_logs",
+    "databricks_get_statement_result_chunk",
+    "databricks_get_statement_status",
+    "databricks_get_vector_search_endpoint",
+    "databricks_get_vector_search_index",
+    "databricks_get_warehouse",
+    "databricks_list_cluster_events",
+    "databricks_list_pipeline_events",
+    "databricks_list_quality_monitor_refreshes",
+    "databricks_list_query_history",
+    "databricks_list_runs",
+    "databricks_query_serving_endpoint",
+    "databricks_query_vector_search_index",
+    "databricks_search_runs",
+    "databricks_table_preview",
+    "databricks_validate_storage_credential",
+    "databricks_wait_for_statement",
+    "databricks_workspace_status",
+})
+
+# Tools that run caller-supplied SQL, mapped to the argument holding it. They
+# invalidate only when the SQL may write; the batch tool takes a JSON array.
+_SQL_TOOLS = {
+    "databricks_execute_sql": "statement",
+    "databricks_execute_sql_batch": "statements",
+    "databricks_query_as_markdown": "sql",
+}
+
+# WITH is left out: a CTE can front an INSERT or MERGE
+_READ_STATEMENT_RE = re.compile(r"\s*(SELECT|SHOW|DESCRIBE|DESC|EXPLAIN)\b", re.IGNORECASE)
+
+
+def is_cacheable_tool(name: str) -> bool:
+    """Return True if a tool's responses may be reused within the TTL."""
+    if name in _UNCACHED_READ_TOOLS:
+        return False
+    return name in _CACHED_READ_TOOLS or name.startswith(_READ_ONLY_PREFIXES)
+
+
+def is_read_only_tool(name: str) -> bool:
+    """Return True if a tool name denotes a side-effect-free read."""
+    return name in _UNCACHED_READ_TOOLS or is_cacheable_tool(name)
+
+
+def is_read_statement(sql: str) -> bool:
+    """Return True if a SQL statement is a plain read (SELECT, SHOW, ...)."""
+    return _READ_STATEMENT_RE.match(sql) is not None
+
+
+def _sql_may_write(name: str, kwargs: dict[str, Any]) -> bool:
+    """Return True unless the SQL passed to a SQL tool is known to be read-only."""
+    sql = kwargs.get(_SQL_TOOLS[name])
+    if name == "databricks_execute_sql_batch":
+        try:
+            sql = from_json(sql)
+        except (TypeError, ValueError):
+            return True
+        if not isinstance(sql, list):
+            return True
+        return not all(isinstance(s, str) and is_read_statement(s) for s in sql)
+    return not (isinstance(sql, str) and is_read_statement(sql))
+
+
+class ResponseCache:
+    """TTL-bounded LRU cache of tool responses.
+
+    Cacheable read-only tools are keyed by ``(tool name, arguments)`` and
+    served from the cache for ``ttl`` seconds; error responses are not
+    stored. Polling and data-query reads pass straight through, SQL tools
+    invalidate only for statements that may write, and every other tool
+    clears the cache when it runs, so agents never read their own writes
+    stale.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 512) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by clear() so reads that started before a write don't store
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of times the cache has been cleared."""
+        return self._generation
+
+    def get(self, key: tuple) -> Any | None:
+        """Return a fresh cached value for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Any, generation: int | None = None) -> None:
+        """Store value under key, evicting the least recently used entry if full.
+
+        If ``generation`` is given and the cache has been cleared since it was
+        read, the value may predate a write and is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a tool function so reads are cached and writes invalidate."""
+        if is_cacheable_tool(name):
+
+            @functools.wraps(fn)
+            def cached(*args: Any, **kwargs: Any) -> Any:
+                key = (name, args, tuple(sorted(kwargs.items())))
+                value = self.get(key)
+                if value is None:
+                    generation = self.generation
+                    value = fn(*args, **kwargs)
+                    # A transient failure must not be replayed for the whole TTL
+                    if not isinstance(value, ErrorMessage):
+                        self.put(key, value, generation)
+                return value
+
+            return cached
+
+        if is_read_only_tool(name):
+            return fn
+
+        @functools.wraps(fn)
+        def invalidating(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.clear()
+
+        if name not in _SQL_TOOLS:
+            return invalidating
+
+        @functools.wraps(fn)
+        def sql_tool(*args: Any, **kwargs: Any) -> Any:
+            if _sql_may_write(name, kwargs):
+                return invalidating(*args, **kwargs)
+            return fn(*args, **kwargs)
+
+        return sql_tool
@@ -1,4 +1,4 @@
-"""Databricks WorkspaceClient configuration and tool filtering."""
+"""Databricks WorkspaceClient configuration, response caching, and tool filtering."""
 
 from __future__ import annotations
 
@@ -6,6 +6,10 @@ import os
 from functools import lru_cache
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.config import Config
+
+_DEFAULT_CACHE_TTL = 3.0
+_DEFAULT_HTTP_POOL_SIZE = 50
 
 
 @lru_cache(maxsize=1)
@@ -15,8 +19,59 @@ def get_workspace_client() -> WorkspaceClient:
     Auth is fully delegated to the SDK's unified auth mechanism.
     Supports: PAT, OAuth M2M, Azure AD, Azure CLI, Databricks CLI profile,
     Google credentials, and more — all auto-detected.
+
+    The client owns a single pooled ``requests.Session``, so caching it also
+    keeps HTTP connections (and their TLS sessions) alive across tool calls.
+    The pool is sized by ``get_http_pool_size()`` so concurrent tool calls
+    do not queue for a free connection. Retries for 429/5xx responses are
+    handled by the SDK itself.
+    """
+    pool_size = get_http_pool_size()
+    return WorkspaceClient(
+        config=Config(max_connection_pools=pool_size, max_connections_per_pool=pool_size)
+    )
+
+
+def get_http_pool_size() -> int:
+    """Get the number of pooled HTTP connections kept for the workspace.
+
+    Environment variables:
+        DATABRICKS_MCP_HTTP_POOL_SIZE: Maximum concurrent keep-alive
+            connections to the workspace (default 50, minimum 1).
+    """
+    raw = os.environ.get("DATABRICKS_MCP_HTTP_POOL_SIZE", "").strip()
+    if not raw:
+        return _DEFAULT_HTTP_POOL_SIZE
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        return _DEFAULT_HTTP_POOL_SIZE
+
+
+def get_cache_ttl() -> float:
+    """Get the read-only tool response cache TTL in seconds.
+
+    Environment variables:
+        DATABRICKS_MCP_CACHE_TTL: Seconds to reuse get_*/list_* responses
+            (default 3). Set to 0 to disable caching.
+    """
+    raw = os.environ.get("DATABRICKS_MCP_CACHE_TTL", "").strip()
+    if not raw:
+        return _DEFAULT_CACHE_TTL
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return _DEFAULT_CACHE_TTL
+
+
+def is_warmup_enabled() -> bool:
+    """Check whether common list tools should be prefetched at startup.
+
+    Environment variables:
+        DATABRICKS_MCP_WARMUP: Set to 1/true/yes to resolve auth, open pooled
+            connections and prime the response cache in a background thread.
     """
-    return WorkspaceClient()
+    return os.environ.get("DATABRICKS_MCP_WARMUP", "").strip().lower() in ("1", "true", "yes")
 
 
 def get_tool_filter() -> tuple[set[str] | None, set[str] | None]:
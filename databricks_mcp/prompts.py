@@ -21,7 +21,7 @@ def register_prompts(mcp: FastMCP) -> None:
                 f"1. Call databricks_get_catalog(name='{catalog_name}') to see catalog details\n"
                 f"2. Call databricks_list_schemas(catalog_name='{catalog_name}') to list all schemas\n"
                 "3. For each schema, call databricks_list_tables to see the tables\n"
-                "4. For the most interesting tables, call databricks_get_table to see columns and stats\n"
+                "4. For the most interesting tables, call databricks_get_tables_bulk to see columns and stats\n"
                 "5. Summarize what data is available, organized by schema"
             )
         return (
@@ -29,7 +29,7 @@ def register_prompts(mcp: FastMCP) -> None:
             "1. Call databricks_list_catalogs() to see all available catalogs\n"
             "2. For each catalog, call databricks_list_schemas to see schemas\n"
             "3. Pick the most relevant schemas and call databricks_list_tables\n"
-            "4. For key tables, call databricks_get_table to see columns and stats\n"
+            "4. For key tables, call databricks_get_tables_bulk to see columns and stats\n"
             "5. Provide a summary of the data landscape"
         )
 
@@ -127,7 +127,7 @@ def register_prompts(mcp: FastMCP) -> None:
             "Please answer this by querying the data:\n"
             "1. First, explore the catalog to find relevant tables:\n"
             "   - Call databricks_list_catalogs, then databricks_list_schemas and databricks_list_tables\n"
-            "   - Use databricks_get_table to check column names and types\n"
+            "   - Use databricks_get_tables_bulk to check column names and types\n"
             "2. Find a running SQL warehouse with databricks_list_warehouses\n"
             "   - If none are running, start one\n"
             "3. Write and execute a SQL query with databricks_execute_sql\n"
@@ -2,11 +2,51 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
+import threading
+from typing import Any, Callable
+
+import anyio.to_thread
 from mcp.server.fastmcp import FastMCP
 
-from databricks_mcp.config import is_module_enabled
+from databricks_mcp.cache import ResponseCache
+from databricks_mcp.config import get_cache_ttl, get_workspace_client, is_module_enabled, is_warmup_enabled
+
+
+class _ThreadedFastMCP(FastMCP):
+    """FastMCP that runs synchronous tools in a worker thread.
+
+    Every tool module wraps blocking SDK calls in plain ``def`` functions.
+    FastMCP would call those directly on the event loop, serializing
+    concurrent requests; offloading them lets independent tool calls from
+    the same client overlap their network round trips.
+
+    When a response cache is attached, cacheable read-only tools are served
+    from it and write tools invalidate it (see ``ResponseCache.wrap``).
+    """
+
+    response_cache: ResponseCache | None = None
+
+    def add_tool(self, fn: Callable[..., Any], name: str | None = None, *args: Any, **kwargs: Any) -> None:
+        if not inspect.iscoroutinefunction(fn):
+            if self.response_cache is not None:
+                fn = self.response_cache.wrap(name or fn.__name__, fn)
+            fn = _run_in_thread(fn)
+        super().add_tool(fn, name, *args, **kwargs)
+
+
+def _run_in_thread(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a blocking function as a coroutine executed via anyio's thread pool."""
 
-mcp = FastMCP(
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs))
+
+    return wrapper
+
+
+mcp = _ThreadedFastMCP(
     "databricks",
     description="Comprehensive MCP server for Databricks. Provides tools for Unity Catalog, SQL, "
     "compute, jobs, pipelines, serving endpoints, vector search, apps, Lakebase, dashboards, "
@@ -14,6 +54,9 @@ mcp = FastMCP(
     "grants, storage credentials, external locations, metastores, online tables, global init "
     "scripts, tokens, Git credentials, quality monitors, and command execution.",
 )
+_cache_ttl = get_cache_ttl()
+if _cache_ttl > 0:
+    mcp.response_cache = ResponseCache(ttl=_cache_ttl)
 
 # Register tool modules conditionally based on DATABRICKS_MCP_TOOLS_INCLUDE/EXCLUDE
 _TOOL_MODULES = [
@@ -75,6 +118,34 @@ def _register_tools() -> None:
     register_prompts(mcp)
 
 
+# Cheap, argument-free list tools that most sessions start with
+_WARMUP_TOOLS = (
+    "databricks_list_warehouses",
+    "databricks_list_serving_endpoints",
+    "databricks_list_shares",
+)
+
+
+def _warmup() -> None:
+    """Resolve auth and call common list tools once so first requests start warm.
+
+    Runs the synchronous tool bodies directly (through the response cache,
+    when enabled). Tools return errors as strings, so a failed call only
+    means that tool stays cold.
+    """
+    try:
+        get_workspace_client()
+    except Exception:
+        return
+    for name in _WARMUP_TOOLS:
+        tool = mcp._tool_manager.get_tool(name)
+        if tool is None:
+            continue
+        fn = getattr(tool.fn, "__wrapped__", tool.fn)
+        if not inspect.iscoroutinefunction(fn):
+            fn()
+
+
 def main() -> None:
     """Entry point for the databricks-mcp command."""
     import argparse
@@ -100,6 +171,8 @@ def main() -> None:
     args = parser.parse_args()
 
     _register_tools()
+    if is_warmup_enabled():
+        threading.Thread(target=_warmup, name="databricks-mcp-warmup", daemon=True).start()
 
     if args.transport == "sse":
         # Configure host/port on the FastMCP settings before starting SSE
@@ -7,6 +7,7 @@ integrate with their data, and enable single sign-on access.
 
 from __future__ import annotations
 
+from databricks.sdk.service.apps import App, AppDeployment, AppDeploymentMode
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -78,8 +79,6 @@ def register_tools(mcp: FastMCP) -> None:
             along with the app name for status checking.
         """
         try:
-            from databricks.sdk.service.apps import App
-
             w = get_workspace_client()
             # Initiate creation without waiting for completion
             w.apps.create(app=App(name=name, description=description or None))
@@ -118,8 +117,6 @@ def register_tools(mcp: FastMCP) -> None:
             Confirmation message that the deployment has been initiated.
         """
         try:
-            from databricks.sdk.service.apps import AppDeployment, AppDeploymentMode
-
             w = get_workspace_client()
             deployment_mode = AppDeploymentMode[mode]
             app_deployment = AppDeployment(
@@ -7,6 +7,7 @@ and R code on a cluster through the Databricks Command Execution API.
 
 from __future__ import annotations
 
+from databricks.sdk.service.compute import Language
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -41,8 +42,6 @@ def register_tools(mcp: FastMCP) -> None:
             context_id to use in subsequent commands).
         """
         try:
-            from databricks.sdk.service.compute import Language
-
             w = get_workspace_client()
             result = w.command_execution.create(
                 cluster_id=cluster_id,
@@ -79,8 +78,6 @@ def register_tools(mcp: FastMCP) -> None:
             id (the command_id to check status with).
         """
         try:
-            from databricks.sdk.service.compute import Language
-
             w = get_workspace_client()
             result = w.command_execution.execute(
                 cluster_id=cluster_id,
@@ -6,6 +6,7 @@ instance pools, and cluster policies.
 
 from __future__ import annotations
 
+from databricks.sdk.service.compute import AutoScale
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -90,8 +91,6 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the created cluster details including cluster_id.
         """
         try:
-            from databricks.sdk.service.compute import AutoScale
-
             w = get_workspace_client()
             kwargs = {
                 "cluster_name": cluster_name,
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 
+from databricks.sdk.service.catalog import ConnectionType
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -94,8 +95,6 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the created connection's details.
         """
         try:
-            from databricks.sdk.service.catalog import ConnectionType
-
             w = get_workspace_client()
 
             # Build options dict starting with host and port
@@ -8,6 +8,7 @@ scheduled delivery.
 
 from __future__ import annotations
 
+from databricks.sdk.service.dashboards import Dashboard
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -88,8 +89,6 @@ def register_tools(mcp: FastMCP) -> None:
             new dashboard_id.
         """
         try:
-            from databricks.sdk.service.dashboards import Dashboard
-
             w = get_workspace_client()
 
             # Build the dashboard object with only non-empty fields
@@ -131,8 +130,6 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the updated dashboard's details.
         """
         try:
-            from databricks.sdk.service.dashboards import Dashboard
-
             w = get_workspace_client()
 
             # Build update with only non-empty fields
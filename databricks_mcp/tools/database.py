@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 
+from databricks.sdk.service.database import DatabaseCatalog, DatabaseInstance, DatabaseTable
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -81,8 +82,6 @@ def register_tools(mcp: FastMCP) -> None:
             the instance name for status checking.
         """
         try:
-            from databricks.sdk.service.database import DatabaseInstance
-
             w = get_workspace_client()
             result = w.database.create_database_instance(
                 database_instance=DatabaseInstance(name=name, capacity=capacity),
@@ -191,8 +190,6 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the created catalog's details.
         """
         try:
-            from databricks.sdk.service.database import DatabaseCatalog
-
             w = get_workspace_client()
             result = w.database.create_database_catalog(
                 instance_name=instance_name,
@@ -280,8 +277,6 @@ def register_tools(mcp: FastMCP) -> None:
                                f"Expected format: [{{'name': 'col', 'type': 'TEXT'}}]")
                 )
 
-            from databricks.sdk.service.database import DatabaseTable
-
             w = get_workspace_client()
 
             # Build the fully qualified table name: instance.catalog.schema.table
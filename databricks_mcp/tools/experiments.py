@@ -7,6 +7,7 @@ run tracks parameters, metrics, artifacts, and model outputs.
 
 from __future__ import annotations
 
+from databricks.sdk.service.ml import UpdateRunStatus
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -297,7 +298,6 @@ def register_tools(mcp: FastMCP) -> None:
             w = get_workspace_client()
             kwargs: dict = {"run_id": run_id}
             if status:
-                from databricks.sdk.service.ml import UpdateRunStatus
                 kwargs["status"] = UpdateRunStatus(status)
             if end_time > 0:
                 kwargs["end_time"] = end_time
@@ -6,6 +6,7 @@ such as catalogs, schemas, tables, volumes, functions, and registered models.
 
 from __future__ import annotations
 
+from databricks.sdk.service.catalog import PermissionsChange, Privilege, SecurableType
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -39,8 +40,6 @@ def register_tools(mcp: FastMCP) -> None:
             and their list of privileges.
         """
         try:
-            from databricks.sdk.service.catalog import SecurableType
-
             w = get_workspace_client()
             result = w.grants.get(
                 securable_type=SecurableType(securable_type),
@@ -74,8 +73,6 @@ def register_tools(mcp: FastMCP) -> None:
             including those inherited from parent securables.
         """
         try:
-            from databricks.sdk.service.catalog import SecurableType
-
             w = get_workspace_client()
             result = w.grants.get_effective(
                 securable_type=SecurableType(securable_type),
@@ -112,12 +109,6 @@ def register_tools(mcp: FastMCP) -> None:
         try:
             import json
 
-            from databricks.sdk.service.catalog import (
-                PermissionsChange,
-                Privilege,
-                SecurableType,
-            )
-
             w = get_workspace_client()
             raw_changes = json.loads(changes_json)
 
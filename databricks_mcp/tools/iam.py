@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 
+from databricks.sdk.service.iam import AccessControlRequest
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -420,8 +421,6 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the updated permissions for the object.
         """
         try:
-            from databricks.sdk.service.iam import AccessControlRequest
-
             w = get_workspace_client()
             parsed = json.loads(access_control_list)
             acl = [AccessControlRequest.from_dict(entry) for entry in parsed]
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 
+from databricks.sdk.service.jobs import JobSettings, NotebookTask, SparkPythonTask, Task
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -32,12 +33,13 @@ def register_tools(mcp: FastMCP) -> None:
         Args:
             limit: Maximum number of jobs to return. Must be between 1 and 100.
                    Defaults to 25.
-            name: Optional filter to return only jobs whose name contains this
-                  string (case-insensitive partial match).
+            name: Optional filter to return only jobs with exactly this name
+                  (case-insensitive). Filtering is applied server-side.
         """
         try:
             w = get_workspace_client()
-            kwargs: dict = {}
+            # Request a page sized to the limit so one round trip usually suffices
+            kwargs: dict = {"limit": max(1, min(limit, 100))}
             if name:
                 kwargs["name"] = name
             jobs = paginate(w.jobs.list(**kwargs), max_items=limit)
@@ -94,12 +96,6 @@ def register_tools(mcp: FastMCP) -> None:
                         compute configuration to be added separately.
         """
         try:
-            from databricks.sdk.service.jobs import (
-                NotebookTask,
-                SparkPythonTask,
-                Task,
-            )
-
             w = get_workspace_client()
 
             # Validate that exactly one task type is specified
@@ -305,8 +301,6 @@ def register_tools(mcp: FastMCP) -> None:
                           Example: '{"name": "updated-job", "timeout_seconds": 3600}'
         """
         try:
-            from databricks.sdk.service.jobs import JobSettings
-
             w = get_workspace_client()
             parsed = json.loads(new_settings)
             settings = JobSettings.from_dict(parsed)
@@ -8,6 +8,12 @@ such as feature serving and RAG applications.
 
 from __future__ import annotations
 
+from databricks.sdk.service.catalog import (
+    OnlineTable,
+    OnlineTableSpec,
+    OnlineTableSpecContinuousSchedulingPolicy,
+    OnlineTableSpecTriggeredSchedulingPolicy,
+)
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -47,11 +53,6 @@ def register_tools(mcp: FastMCP) -> None:
         try:
             import json
 
-            from databricks.sdk.service.catalog import (
-                OnlineTable,
-                OnlineTableSpec,
-            )
-
             w = get_workspace_client()
             primary_key_columns = json.loads(primary_key_columns_json)
 
@@ -62,12 +63,8 @@ def register_tools(mcp: FastMCP) -> None:
 
             # Set sync mode: triggered or continuous (default)
             if run_triggered:
-                from databricks.sdk.service.catalog import OnlineTableSpecTriggeredSchedulingPolicy
-
                 spec_kwargs["run_triggered"] = OnlineTableSpecTriggeredSchedulingPolicy()
             else:
-                from databricks.sdk.service.catalog import OnlineTableSpecContinuousSchedulingPolicy
-
                 spec_kwargs["run_continuously"] = OnlineTableSpecContinuousSchedulingPolicy()
 
             table = OnlineTable(
@@ -10,6 +10,7 @@ the transformation logic using DLT-specific APIs.
 
 from __future__ import annotations
 
+from databricks.sdk.service.pipelines import NotebookLibrary, PipelineLibrary
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -91,11 +92,6 @@ def register_tools(mcp: FastMCP) -> None:
                         pipeline runs in triggered mode (one-time refresh per update).
         """
         try:
-            from databricks.sdk.service.pipelines import (
-                NotebookLibrary,
-                PipelineLibrary,
-            )
-
             w = get_workspace_client()
 
             kwargs: dict = {
@@ -8,6 +8,7 @@ queried for analysis.
 
 from __future__ import annotations
 
+from databricks.sdk.service.catalog import MonitorSnapshot
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -57,8 +58,6 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the created monitor's configuration details.
         """
         try:
-            from databricks.sdk.service.catalog import MonitorSnapshot
-
             w = get_workspace_client()
             kwargs: dict = {
                 "table_name": table_name,
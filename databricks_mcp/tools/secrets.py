@@ -8,11 +8,19 @@ and last-updated timestamps) but never the secret values themselves.
 
 from __future__ import annotations
 
+from databricks.sdk.service.workspace import AclPermission
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
 from databricks_mcp.utils import format_error, paginate, to_json
 
+# Resolved once at import so put_secret_acl avoids the enum's KeyError path
+_ACL_PERMISSIONS = {
+    "READ": AclPermission.READ,
+    "WRITE": AclPermission.WRITE,
+    "MANAGE": AclPermission.MANAGE,
+}
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register all secret management tools with the MCP server."""
@@ -184,14 +192,17 @@ def register_tools(mcp: FastMCP) -> None:
         Returns:
             Confirmation message on success.
         """
+        acl_permission = _ACL_PERMISSIONS.get(permission.upper())
+        if acl_permission is None:
+            return format_error(ValueError(
+                f"Invalid permission '{permission}'. Must be one of: READ, WRITE, MANAGE."
+            ))
         try:
-            from databricks.sdk.service.workspace import AclPermission
-
             w = get_workspace_client()
             w.secrets.put_acl(
                 scope=scope,
                 principal=principal,
-                permission=AclPermission[permission],
+                permission=acl_permission,
             )
             return f"ACL set on scope '{scope}': {principal} -> {permission}."
         except Exception as e:
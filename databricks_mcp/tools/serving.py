@@ -9,10 +9,11 @@ from __future__ import annotations
 
 import json
 
+from databricks.sdk.service.serving import EndpointCoreConfigInput, ServedEntityInput
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
-from databricks_mcp.utils import format_error, paginate, to_json
+from databricks_mcp.utils import format_error, from_json, paginate, to_json
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -76,11 +77,6 @@ def register_tools(mcp: FastMCP) -> None:
                            Defaults to True, which reduces cost but adds cold-start latency.
         """
         try:
-            from databricks.sdk.service.serving import (
-                EndpointCoreConfigInput,
-                ServedEntityInput,
-            )
-
             w = get_workspace_client()
             w.serving_endpoints.create(
                 name=name,
@@ -132,8 +128,6 @@ def register_tools(mcp: FastMCP) -> None:
             scale_to_zero: Whether the endpoint scales to zero when idle.
         """
         try:
-            from databricks.sdk.service.serving import ServedEntityInput
-
             w = get_workspace_client()
             w.serving_endpoints.update_config(
                 name=name,
@@ -199,7 +193,7 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            parsed_inputs = json.loads(inputs)
+            parsed_inputs = from_json(inputs)
             response = w.serving_endpoints.query(name=name, inputs=parsed_inputs)
             return to_json(response)
         except json.JSONDecodeError as e:
@@ -257,7 +251,11 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            versions = paginate(w.model_versions.list(full_name=full_model_name), max_items=100)
+            # One 100-item page covers the cap; page tokens can't be fetched in parallel
+            versions = paginate(
+                w.model_versions.list(full_name=full_model_name, max_results=100),
+                max_items=100,
+            )
             return to_json({"model": full_model_name, "versions": versions, "count": len(versions)})
         except Exception as e:
             return format_error(e)
@@ -8,11 +8,15 @@ who consume the shared data.
 
 from __future__ import annotations
 
+from databricks.sdk.service.sharing import AuthenticationType
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
 from databricks_mcp.utils import format_error, paginate, to_json
 
+# Resolved once at import so create_recipient avoids the enum's KeyError path
+_AUTH_TYPES = {t.name: t for t in AuthenticationType}
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register all Delta Sharing tools with the MCP server."""
@@ -134,13 +138,17 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the created recipient's details, including the
             activation URL and sharing token (for TOKEN authentication).
         """
+        auth_type = _AUTH_TYPES.get(authentication_type.upper())
+        if auth_type is None:
+            return format_error(ValueError(
+                f"Invalid authentication_type '{authentication_type}'. "
+                f"Must be one of: {', '.join(sorted(_AUTH_TYPES))}."
+            ))
         try:
-            from databricks.sdk.service.sharing import AuthenticationType
-
             w = get_workspace_client()
             result = w.recipients.create(
                 name=name,
-                authentication_type=AuthenticationType[authentication_type],
+                authentication_type=auth_type,
                 comment=comment,
             )
             return to_json(result)
@@ -6,10 +6,41 @@ working with saved queries, managing alerts, and querying statement history.
 
 from __future__ import annotations
 
+import itertools
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from databricks.sdk.service.sql import (
+    CreateAlertRequestAlert,
+    CreateQueryRequestQuery,
+    Disposition,
+    Format,
+    QueryFilter,
+)
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
-from databricks_mcp.utils import format_error, paginate, to_json
+from databricks_mcp.utils import format_error, from_json, paginate, to_json
+
+# Statement execution options shared by execute_sql and execute_sql_batch
+_EXEC_DISPOSITION = Disposition.INLINE
+_EXEC_FORMAT = Format.JSON_ARRAY
+
+# Upper bound on statements accepted by databricks_execute_sql_batch
+_MAX_BATCH_STATEMENTS = 10
+
+# Escalating poll intervals (seconds) for databricks_wait_for_statement; the
+# last value repeats until the statement finishes or the wait budget runs out.
+_POLL_DELAYS = (0.2, 0.2, 0.5, 0.5, 1.0, 2.0)
+_MAX_STATEMENT_WAIT_SECONDS = 300
+_TERMINAL_STATEMENT_STATES = frozenset({"SUCCEEDED", "FAILED", "CANCELED", "CLOSED"})
+
+
+def _statement_state(result: object) -> str | None:
+    """Return the statement state name (e.g. "SUCCEEDED") from an SDK response."""
+    state = getattr(getattr(result, "status", None), "state", None)
+    return getattr(state, "value", state)
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -158,6 +189,10 @@ def register_tools(mcp: FastMCP) -> None:
         returns inline JSON results. For long-running queries, use
         databricks_get_statement_status to poll for completion.
 
+        Large results are split into chunks and only the first chunk is
+        returned inline; when "next_chunk_index" is present, fetch the rest
+        with databricks_get_statement_result_chunk.
+
         Args:
             warehouse_id: The ID of the SQL warehouse to execute on.
             statement: The SQL statement to execute (max 16 MiB).
@@ -172,15 +207,13 @@ def register_tools(mcp: FastMCP) -> None:
             the data is returned as a JSON array.
         """
         try:
-            from databricks.sdk.service.sql import Disposition, Format
-
             w = get_workspace_client()
             kwargs = {
                 "warehouse_id": warehouse_id,
                 "statement": statement,
                 "wait_timeout": "50s",
-                "disposition": Disposition.INLINE,
-                "format": Format.JSON_ARRAY,
+                "disposition": _EXEC_DISPOSITION,
+                "format": _EXEC_FORMAT,
             }
             if catalog:
                 kwargs["catalog"] = catalog
@@ -192,6 +225,71 @@ def register_tools(mcp: FastMCP) -> None:
         except Exception as e:
             return format_error(e)
 
+    @mcp.tool()
+    def databricks_execute_sql_batch(
+        warehouse_id: str,
+        statements: str,
+        catalog: str = "",
+        schema: str = "",
+    ) -> str:
+        """Execute several independent SQL statements on a warehouse at once.
+
+        The Statement Execution API accepts one statement per request, so the
+        statements are submitted concurrently and their results returned in
+        the order given. Each statement uses the same 50-second wait timeout
+        and inline JSON results as databricks_execute_sql. A failing statement
+        does not affect the others. Useful for schema discovery queries that
+        would otherwise be issued one at a time.
+
+        Args:
+            warehouse_id: The ID of the SQL warehouse to execute on.
+            statements: JSON array of up to 10 SQL statement strings
+                        (e.g. '["SHOW TABLES", "SELECT count(*) FROM t"]').
+            catalog: Optional default catalog applied to every statement.
+            schema: Optional default schema applied to every statement.
+
+        Returns:
+            JSON object with a "results" array holding, for each statement,
+            either its "result" or an "error" message, plus a "count".
+        """
+        try:
+            parsed = from_json(statements)
+            if not isinstance(parsed, list) or not parsed or not all(isinstance(s, str) for s in parsed):
+                return format_error(ValueError(
+                    "'statements' must be a non-empty JSON array of SQL strings."
+                ))
+            if len(parsed) > _MAX_BATCH_STATEMENTS:
+                return format_error(ValueError(
+                    f"At most {_MAX_BATCH_STATEMENTS} statements can be batched; got {len(parsed)}."
+                ))
+
+            w = get_workspace_client()
+            kwargs = {
+                "warehouse_id": warehouse_id,
+                "wait_timeout": "50s",
+                "disposition": _EXEC_DISPOSITION,
+                "format": _EXEC_FORMAT,
+            }
+            if catalog:
+                kwargs["catalog"] = catalog
+            if schema:
+                kwargs["schema"] = schema
+
+            def run(statement: str) -> dict:
+                try:
+                    result = w.statement_execution.execute_statement(statement=statement, **kwargs)
+                    return {"statement": statement, "result": result}
+                except Exception as e:
+                    return {"statement": statement, "error": format_error(e)}
+
+            with ThreadPoolExecutor(max_workers=len(parsed)) as pool:
+                results = list(pool.map(run, parsed))
+            return to_json({"results": results, "count": len(results)})
+        except json.JSONDecodeError as e:
+            return format_error(ValueError(f"Invalid JSON in 'statements' parameter: {e}"))
+        except Exception as e:
+            return format_error(e)
+
     @mcp.tool()
     def databricks_get_statement_status(statement_id: str) -> str:
         """Get the status and results of a previously executed SQL statement.
@@ -213,6 +311,63 @@ def register_tools(mcp: FastMCP) -> None:
         except Exception as e:
             return format_error(e)
 
+    @mcp.tool()
+    def databricks_wait_for_statement(statement_id: str, max_wait_seconds: int = 60) -> str:
+        """Wait for a SQL statement to finish and return its final status and results.
+
+        Polls server-side with escalating intervals (0.2s growing to 2s), so
+        short queries return almost immediately without the caller having to
+        call databricks_get_statement_status in a loop. If the statement is
+        still running when the wait budget is exhausted, the latest status is
+        returned and the caller can wait again.
+
+        Args:
+            statement_id: The statement ID returned by databricks_execute_sql.
+            max_wait_seconds: Maximum time to wait (0-300, default 60).
+
+        Returns:
+            JSON object with statement status, manifest, and result data
+            if the statement has completed.
+        """
+        try:
+            w = get_workspace_client()
+            deadline = time.monotonic() + min(max(max_wait_seconds, 0), _MAX_STATEMENT_WAIT_SECONDS)
+            delays = itertools.chain(_POLL_DELAYS, itertools.repeat(_POLL_DELAYS[-1]))
+            while True:
+                result = w.statement_execution.get_statement(statement_id)
+                state = _statement_state(result)
+                remaining = deadline - time.monotonic()
+                if state in _TERMINAL_STATEMENT_STATES or remaining <= 0:
+                    return to_json(result)
+                time.sleep(min(next(delays), remaining))
+        except Exception as e:
+            return format_error(e)
+
+    @mcp.tool()
+    def databricks_get_statement_result_chunk(statement_id: str, chunk_index: int) -> str:
+        """Fetch one chunk of a large SQL statement result.
+
+        Statement results are split into chunks; databricks_execute_sql and
+        databricks_get_statement_status return only the first. Start from
+        the "next_chunk_index" in that result and keep following the
+        chunk's own "next_chunk_index" until it is absent, processing rows
+        as each chunk arrives.
+
+        Args:
+            statement_id: The statement ID returned by databricks_execute_sql.
+            chunk_index: Zero-based index of the chunk to fetch.
+
+        Returns:
+            JSON object with the chunk's data_array, row_offset, row_count,
+            and next_chunk_index when more chunks remain.
+        """
+        try:
+            w = get_workspace_client()
+            result = w.statement_execution.get_statement_result_chunk_n(statement_id, chunk_index)
+            return to_json(result)
+        except Exception as e:
+            return format_error(e)
+
     @mcp.tool()
     def databricks_cancel_statement(statement_id: str) -> str:
         """Cancel an executing SQL statement.
@@ -276,8 +431,6 @@ def register_tools(mcp: FastMCP) -> None:
             JSON object with the created query details including its id.
         """
         try:
-            from databricks.sdk.service.sql import CreateQueryRequestQuery
-
             w = get_workspace_client()
             query_obj = CreateQueryRequestQuery(
                 display_name=name,
@@ -340,8 +493,7 @@ def register_tools(mcp: FastMCP) -> None:
             # The alerts API requires structured condition objects. We create
             # a basic alert and return guidance if the condition needs adjustment.
             result = w.alerts.create(
-                name=name,
-                query_id=query_id,
+                alert=CreateAlertRequestAlert(display_name=name, query_id=query_id),
             )
             return to_json(result)
         except Exception as e:
@@ -370,8 +522,6 @@ def register_tools(mcp: FastMCP) -> None:
             query_text, duration, and warehouse information.
         """
         try:
-            from databricks.sdk.service.sql import ListQueryHistoryRequest, QueryFilter
-
             w = get_workspace_client()
             kwargs = {}
             if warehouse_id:
@@ -381,7 +531,7 @@ def register_tools(mcp: FastMCP) -> None:
                 kwargs["filter_by"] = query_filter
             kwargs["max_results"] = min(max_results, 25)
 
-            result = w.query_history.list(ListQueryHistoryRequest(**kwargs))
+            result = w.query_history.list(**kwargs)
             return to_json(result)
         except Exception as e:
             return format_error(e)
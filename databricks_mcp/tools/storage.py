@@ -7,6 +7,7 @@ cloud storage paths to Unity Catalog for governance).
 
 from __future__ import annotations
 
+from databricks.sdk.service.catalog import AwsIamRoleRequest, AzureServicePrincipal
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
@@ -97,12 +98,8 @@ def register_tools(mcp: FastMCP) -> None:
 
             # Build cloud-specific credential object
             if aws_iam_role_arn:
-                from databricks.sdk.service.catalog import AwsIamRoleRequest
-
                 kwargs["aws_iam_role"] = AwsIamRoleRequest(role_arn=aws_iam_role_arn)
             elif azure_service_principal_application_id:
-                from databricks.sdk.service.catalog import AzureServicePrincipal
-
                 kwargs["azure_service_principal"] = AzureServicePrincipal(
                     directory_id=azure_service_principal_directory_id,
                     application_id=azure_service_principal_application_id,
@@ -143,8 +140,6 @@ def register_tools(mcp: FastMCP) -> None:
             if comment:
                 kwargs["comment"] = comment
             if aws_iam_role_arn:
-                from databricks.sdk.service.catalog import AwsIamRoleRequest
-
                 kwargs["aws_iam_role"] = AwsIamRoleRequest(role_arn=aws_iam_role_arn)
 
             result = w.storage_credentials.update(**kwargs)
@@ -206,8 +201,6 @@ def register_tools(mcp: FastMCP) -> None:
             if url:
                 kwargs["url"] = url
             if aws_iam_role_arn:
-                from databricks.sdk.service.catalog import AwsIamRoleRequest
-
                 kwargs["aws_iam_role"] = AwsIamRoleRequest(role_arn=aws_iam_role_arn)
 
             result = w.storage_credentials.validate(**kwargs)
@@ -6,11 +6,22 @@ and registered models within Unity Catalog.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+from databricks.sdk.service.catalog import VolumeType
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
 from databricks_mcp.utils import format_error, paginate, to_json
 
+# Resolved once at import so create_volume validates with a dict lookup
+_VOLUME_TYPES = {v.value: v for v in VolumeType}
+
+_MAX_BULK_TABLES = 20
+
+# Size pages to paginate's 100-item cap instead of the server-configured default
+_LIST_PAGE_SIZE = 100
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register all Unity Catalog tools with the MCP server."""
@@ -26,7 +37,7 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            results = paginate(w.catalogs.list())
+            results = paginate(w.catalogs.list(max_results=_LIST_PAGE_SIZE))
             return to_json(results)
         except Exception as e:
             return format_error(e)
@@ -105,7 +116,7 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            results = paginate(w.schemas.list(catalog_name=catalog_name))
+            results = paginate(w.schemas.list(catalog_name=catalog_name, max_results=_LIST_PAGE_SIZE))
             return to_json(results)
         except Exception as e:
             return format_error(e)
@@ -187,7 +198,11 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            results = paginate(w.tables.list(catalog_name=catalog_name, schema_name=schema_name))
+            results = paginate(
+                w.tables.list(
+                    catalog_name=catalog_name, schema_name=schema_name, max_results=_LIST_PAGE_SIZE
+                )
+            )
             return to_json(results)
         except Exception as e:
             return format_error(e)
@@ -212,6 +227,45 @@ def register_tools(mcp: FastMCP) -> None:
         except Exception as e:
             return format_error(e)
 
+    @mcp.tool()
+    def databricks_get_tables_bulk(full_names: str) -> str:
+        """Get detailed information about several tables in one call.
+
+        Fetches the tables concurrently, so inspecting the columns of every
+        table returned by databricks_list_tables takes about one round trip
+        instead of one per table. A table that cannot be fetched does not
+        affect the others.
+
+        Args:
+            full_names: Comma-separated list of up to 20 full three-level
+                        table names (e.g. "cat.sch.orders,cat.sch.customers").
+
+        Returns:
+            JSON object mapping each table name to its details (as returned
+            by databricks_get_table) or to an "error" message, plus a "count".
+        """
+        names = list(dict.fromkeys(n.strip() for n in full_names.split(",") if n.strip()))
+        if not names:
+            return format_error(ValueError("full_names must contain at least one table name."))
+        if len(names) > _MAX_BULK_TABLES:
+            return format_error(ValueError(
+                f"At most {_MAX_BULK_TABLES} tables can be fetched at once; got {len(names)}."
+            ))
+        try:
+            w = get_workspace_client()
+
+            def fetch(full_name: str) -> object:
+                try:
+                    return w.tables.get(full_name)
+                except Exception as e:
+                    return {"error": format_error(e)}
+
+            with ThreadPoolExecutor(max_workers=len(names)) as pool:
+                tables = dict(zip(names, pool.map(fetch, names)))
+            return to_json({"tables": tables, "count": len(tables)})
+        except Exception as e:
+            return format_error(e)
+
     @mcp.tool()
     def databricks_delete_table(full_name: str) -> str:
         """Delete a table from Unity Catalog.
@@ -252,7 +306,11 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            results = paginate(w.volumes.list(catalog_name=catalog_name, schema_name=schema_name))
+            results = paginate(
+                w.volumes.list(
+                    catalog_name=catalog_name, schema_name=schema_name, max_results=_LIST_PAGE_SIZE
+                )
+            )
             return to_json(results)
         except Exception as e:
             return format_error(e)
@@ -280,15 +338,19 @@ def register_tools(mcp: FastMCP) -> None:
         Returns:
             JSON object with the created volume's details.
         """
+        vol_type = _VOLUME_TYPES.get(volume_type.upper())
+        if vol_type is None:
+            return format_error(ValueError(
+                f"Invalid volume_type '{volume_type}'. "
+                f"Must be one of: {', '.join(sorted(_VOLUME_TYPES))}."
+            ))
         try:
-            from databricks.sdk.service.catalog import VolumeType
-
             w = get_workspace_client()
             result = w.volumes.create(
                 name=name,
                 catalog_name=catalog_name,
                 schema_name=schema_name,
-                volume_type=VolumeType(volume_type),
+                volume_type=vol_type,
                 comment=comment,
             )
             return to_json(result)
@@ -333,7 +395,11 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            results = paginate(w.functions.list(catalog_name=catalog_name, schema_name=schema_name))
+            results = paginate(
+                w.functions.list(
+                    catalog_name=catalog_name, schema_name=schema_name, max_results=_LIST_PAGE_SIZE
+                )
+            )
             return to_json(results)
         except Exception as e:
             return format_error(e)
@@ -408,7 +474,7 @@ def register_tools(mcp: FastMCP) -> None:
                 kwargs["catalog_name"] = catalog_name
             if schema_name:
                 kwargs["schema_name"] = schema_name
-            results = paginate(w.registered_models.list(**kwargs))
+            results = paginate(w.registered_models.list(max_results=_LIST_PAGE_SIZE, **kwargs))
             return to_json(results)
         except Exception as e:
             return format_error(e)
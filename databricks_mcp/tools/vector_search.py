@@ -12,10 +12,21 @@ from __future__ import annotations
 
 import json
 
+from databricks.sdk.service.vectorsearch import (
+    DeltaSyncVectorIndexSpecRequest,
+    DirectAccessVectorIndexSpec,
+    EmbeddingSourceColumn,
+    EndpointType,
+    VectorIndexType,
+)
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
-from databricks_mcp.utils import format_error, paginate, to_json
+from databricks_mcp.utils import format_error, from_json, paginate, to_json
+
+# Resolved once at import so create tools validate with a dict lookup
+_ENDPOINT_TYPES = {t.name: t for t in EndpointType}
+_INDEX_TYPES = {t.name: t for t in VectorIndexType}
 
 
 def register_tools(mcp: FastMCP) -> None:
@@ -51,13 +62,17 @@ def register_tools(mcp: FastMCP) -> None:
             endpoint_type: Type of endpoint to create. Currently only "STANDARD" is
                            supported. Defaults to "STANDARD".
         """
+        ep_type = _ENDPOINT_TYPES.get(endpoint_type.upper())
+        if ep_type is None:
+            return format_error(ValueError(
+                f"Invalid endpoint_type '{endpoint_type}'. "
+                f"Must be one of: {', '.join(sorted(_ENDPOINT_TYPES))}."
+            ))
         try:
-            from databricks.sdk.service.vectorsearch import EndpointType
-
             w = get_workspace_client()
             w.vector_search_endpoints.create_endpoint(
                 name=name,
-                endpoint_type=EndpointType[endpoint_type],
+                endpoint_type=ep_type,
             )
             # Return immediately without blocking on .result()
             return to_json({
@@ -69,10 +84,6 @@ def register_tools(mcp: FastMCP) -> None:
                     "Use databricks_get_vector_search_endpoint to check status."
                 ),
             })
-        except KeyError:
-            return format_error(ValueError(
-                f"Invalid endpoint_type '{endpoint_type}'. Supported values: STANDARD"
-            ))
         except Exception as e:
             return format_error(e)
 
@@ -169,13 +180,6 @@ def register_tools(mcp: FastMCP) -> None:
                                            embeddings (optional, for DELTA_SYNC only).
         """
         try:
-            from databricks.sdk.service.vectorsearch import (
-                DeltaSyncVectorIndexSpecRequest,
-                DirectAccessVectorIndexSpec,
-                EmbeddingSourceColumn,
-                VectorIndexType,
-            )
-
             w = get_workspace_client()
 
             delta_sync_spec = None
@@ -217,7 +221,7 @@ def register_tools(mcp: FastMCP) -> None:
                 name=name,
                 endpoint_name=endpoint_name,
                 primary_key=primary_key,
-                index_type=VectorIndexType[index_type],
+                index_type=_INDEX_TYPES[index_type],
                 delta_sync_index_spec=delta_sync_spec,
                 direct_access_index_spec=direct_access_spec,
             )
@@ -298,7 +302,7 @@ def register_tools(mcp: FastMCP) -> None:
                 kwargs["query_text"] = query_text
             elif query_vector:
                 try:
-                    kwargs["query_vector"] = json.loads(query_vector)
+                    kwargs["query_vector"] = from_json(query_vector)
                 except json.JSONDecodeError as e:
                     return format_error(ValueError(f"Invalid JSON in 'query_vector': {e}"))
 
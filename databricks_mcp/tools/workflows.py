@@ -6,93 +6,197 @@ in a single invocation, making common multi-step workflows more efficient.
 
 from __future__ import annotations
 
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from databricks.sdk.service.sql import Disposition, Format
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
-from databricks_mcp.utils import format_error, paginate, to_json
+from databricks_mcp.utils import format_error, to_json
+
+_MARKDOWN_MAX_ROWS = 100
+
+# How long a warehouse seen RUNNING is reused without listing warehouses again
+_WAREHOUSE_HINT_TTL = 30.0
+
+
+def _state_name(state: object) -> str:
+    """Normalize an SDK state enum (or plain string) to its upper-case name."""
+    return str(getattr(state, "value", state) or "").upper()
 
 
 def register_tools(mcp: FastMCP) -> None:
     """Register composite workflow tools with the MCP server."""
 
+    # Last status report per workspace host: (monotonic time computed, JSON)
+    status_cache: dict[str, tuple[float, str]] = {}
+    # Last warehouse seen RUNNING per workspace host: (monotonic time seen, id)
+    warehouse_hint: dict[str, tuple[float, str]] = {}
+
+    def remember_running_warehouse(w, warehouse_id: str) -> None:
+        warehouse_hint[w.config.host] = (time.monotonic(), warehouse_id)
+
+    def find_running_warehouse(w) -> tuple[str, bool]:
+        """Return (warehouse_id, from_hint); the id is empty if none is running."""
+        hint = warehouse_hint.get(w.config.host)
+        if hint is not None and time.monotonic() - hint[0] < _WAREHOUSE_HINT_TTL:
+            return hint[1], True
+        for wh in w.warehouses.list():
+            if _state_name(getattr(wh, "state", None)) == "RUNNING":
+                remember_running_warehouse(w, wh.id)
+                return wh.id, False
+        return "", False
+
+    def warehouse_running(w, warehouse_id: str) -> bool:
+        """Return True if the warehouse exists, is RUNNING, and its state can be read.
+
+        Any lookup failure (missing, permission, throttling) counts as not running
+        so the caller falls back to a fresh lookup or re-raises the query error.
+        """
+        try:
+            return _state_name(getattr(w.warehouses.get(warehouse_id), "state", None)) == "RUNNING"
+        except Exception:
+            return False
+
+    def preview_sample(w, table_name: str, warehouse_id: str, limit: int) -> dict | str:
+        """Run the table_preview sample query, resolving a warehouse if needed."""
+        wh_id, from_hint = (warehouse_id, False) if warehouse_id else find_running_warehouse(w)
+        if not wh_id:
+            return "No running SQL warehouse found. Provide a warehouse_id or start one."
+
+        def run_preview(wh_id: str):
+            return w.statement_execution.execute_statement(
+                warehouse_id=wh_id,
+                statement=f"SELECT * FROM {table_name} LIMIT {limit}",
+                disposition=Disposition.INLINE,
+                format=Format.JSON_ARRAY,
+                wait_timeout="30s",
+            )
+
+        # A remembered warehouse may have stopped or been deleted since. Only
+        # then forget it and retry once with a fresh lookup; any other failure
+        # (bad table name, SQL error) would just fail again.
+        try:
+            response = run_preview(wh_id)
+        except Exception:
+            if not from_hint or warehouse_running(w, wh_id):
+                raise
+            warehouse_hint.pop(w.config.host, None)
+            wh_id, _ = find_running_warehouse(w)
+            if not wh_id:
+                raise
+            response = run_preview(wh_id)
+
+        if not (response.result and response.result.data_array):
+            return "No data returned"
+        manifest = response.manifest
+        columns = (
+            [col.name for col in manifest.schema.columns]
+            if manifest and manifest.schema and manifest.schema.columns
+            else []
+        )
+        return {
+            "columns": columns,
+            "rows": response.result.data_array[:limit],
+            "row_count": len(response.result.data_array),
+        }
+
     @mcp.tool()
-    def databricks_workspace_status() -> str:
+    def databricks_workspace_status(ttl_seconds: int = 0) -> str:
         """Get a comprehensive status overview of the Databricks workspace.
 
         Returns a health dashboard showing the status of clusters, warehouses,
         jobs, serving endpoints, and catalog access -- all in one call.
+
+        Args:
+            ttl_seconds: Accept a previous report if it is at most this many
+                         seconds old, skipping the six service calls. Useful
+                         when polling. Defaults to 0 (always fresh).
         """
         try:
             w = get_workspace_client()
-            status: dict = {}
-
-            # Auth check
-            try:
-                me = w.current_user.me()
-                status["auth"] = {"status": "ok", "user": me.user_name}
-            except Exception as e:
-                status["auth"] = {"status": "error", "error": str(e)}
-
-            # Clusters
-            try:
-                clusters = list(w.clusters.list())
-                running = [
-                    c for c in clusters
-                    if hasattr(c, "state") and str(getattr(c, "state", "")).upper() == "RUNNING"
-                ]
-                status["clusters"] = {
-                    "total": len(clusters),
-                    "running": len(running),
-                    "terminated": len(clusters) - len(running),
-                }
-            except Exception:
-                status["clusters"] = {"status": "unavailable"}
-
-            # SQL Warehouses
-            try:
-                warehouses = list(w.warehouses.list())
-                active = [
-                    wh for wh in warehouses
-                    if hasattr(wh, "state") and str(getattr(wh, "state", "")).upper() == "RUNNING"
-                ]
-                status["sql_warehouses"] = {
-                    "total": len(warehouses),
-                    "running": len(active),
-                }
-            except Exception:
-                status["sql_warehouses"] = {"status": "unavailable"}
+            host = w.config.host
+            if ttl_seconds > 0:
+                cached = status_cache.get(host)
+                if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+                    return cached[1]
+
+            def auth() -> dict:
+                try:
+                    me = w.current_user.me()
+                    return {"status": "ok", "user": me.user_name}
+                except Exception as e:
+                    return {"status": "error", "error": str(e)}
+
+            def clusters() -> dict:
+                try:
+                    states = [_state_name(getattr(c, "state", None)) for c in w.clusters.list()]
+                    running = states.count("RUNNING")
+                    return {
+                        "total": len(states),
+                        "running": running,
+                        "terminated": len(states) - running,
+                    }
+                except Exception:
+                    return {"status": "unavailable"}
+
+            def sql_warehouses() -> dict:
+                try:
+                    states = [_state_name(getattr(wh, "state", None)) for wh in w.warehouses.list()]
+                    return {
+                        "total": len(states),
+                        "running": states.count("RUNNING"),
+                    }
+                except Exception:
+                    return {"status": "unavailable"}
 
             # Jobs (capped at 100 to avoid large responses)
-            try:
-                jobs = paginate(w.jobs.list(), max_items=100)
-                status["jobs"] = {"total": len(jobs)}
-            except Exception:
-                status["jobs"] = {"status": "unavailable"}
-
-            # Serving endpoints
-            try:
-                endpoints = list(w.serving_endpoints.list())
-                ready = [
-                    ep for ep in endpoints
-                    if hasattr(ep, "state")
-                    and hasattr(ep.state, "ready")
-                    and str(getattr(ep.state, "ready", "")).upper() == "READY"
-                ]
-                status["serving_endpoints"] = {
-                    "total": len(endpoints),
-                    "ready": len(ready),
-                }
-            except Exception:
-                status["serving_endpoints"] = {"status": "unavailable"}
+            def jobs() -> dict:
+                try:
+                    # Only the count is reported, so skip serializing each job
+                    return {"total": sum(1 for _ in itertools.islice(w.jobs.list(), 100))}
+                except Exception:
+                    return {"status": "unavailable"}
 
-            # Unity Catalogs (capped at 50)
-            try:
-                catalogs = paginate(w.catalogs.list(), max_items=50)
-                status["catalogs"] = {"total": len(catalogs)}
-            except Exception:
-                status["catalogs"] = {"status": "unavailable"}
+            def serving_endpoints() -> dict:
+                try:
+                    ready = [
+                        _state_name(getattr(getattr(ep, "state", None), "ready", None))
+                        for ep in w.serving_endpoints.list()
+                    ]
+                    return {
+                        "total": len(ready),
+                        "ready": ready.count("READY"),
+                    }
+                except Exception:
+                    return {"status": "unavailable"}
 
-            return to_json(status)
+            # Unity Catalogs (capped at 50)
+            def catalogs() -> dict:
+                try:
+                    return {"total": sum(1 for _ in itertools.islice(w.catalogs.list(), 50))}
+                except Exception:
+                    return {"status": "unavailable"}
+
+            # The probes are independent round trips, so run them concurrently
+            probes = {
+                "auth": auth,
+                "clusters": clusters,
+                "sql_warehouses": sql_warehouses,
+                "jobs": jobs,
+                "serving_endpoints": serving_endpoints,
+                "catalogs": catalogs,
+            }
+            with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+                futures = {key: pool.submit(probe) for key, probe in probes.items()}
+                status = {key: future.result() for key, future in futures.items()}
+
+            response = to_json(status)
+            # Stamp after the probes finish so the report's age is measured from its data
+            status_cache[host] = (time.monotonic(), response)
+            return response
         except Exception as e:
             return format_error(e)
 
@@ -116,42 +220,29 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             w = get_workspace_client()
-            results: dict = {"steps": []}
+            full_name = f"{catalog_name}.{schema_name}"
+            steps: list[dict] = []
 
             if create_catalog:
                 try:
                     w.catalogs.create(name=catalog_name)
-                    results["steps"].append({
-                        "action": "create_catalog",
-                        "status": "created",
-                        "name": catalog_name,
-                    })
+                    catalog_status = "created"
                 except Exception as e:
-                    if "already exists" in str(e).lower():
-                        results["steps"].append({
-                            "action": "create_catalog",
-                            "status": "already_exists",
-                            "name": catalog_name,
-                        })
-                    else:
+                    if "already exists" not in str(e).lower():
                         raise
+                    catalog_status = "already_exists"
+                steps.append({"action": "create_catalog", "status": catalog_status, "name": catalog_name})
 
             kwargs: dict = {"name": schema_name, "catalog_name": catalog_name}
             if comment:
                 kwargs["comment"] = comment
             w.schemas.create(**kwargs)
-            results["steps"].append({
-                "action": "create_schema",
-                "status": "created",
-                "full_name": f"{catalog_name}.{schema_name}",
-            })
-            results["schema"] = {
-                "catalog": catalog_name,
-                "schema": schema_name,
-                "full_name": f"{catalog_name}.{schema_name}",
-            }
+            steps.append({"action": "create_schema", "status": "created", "full_name": full_name})
 
-            return to_json(results)
+            return to_json({
+                "steps": steps,
+                "schema": {"catalog": catalog_name, "schema": schema_name, "full_name": full_name},
+            })
         except Exception as e:
             return format_error(e)
 
@@ -174,8 +265,6 @@ def register_tools(mcp: FastMCP) -> None:
             schema: Optional schema context for the query.
         """
         try:
-            from databricks.sdk.service.sql import Disposition, Format
-
             w = get_workspace_client()
             kwargs: dict = {
                 "warehouse_id": warehouse_id,
@@ -183,6 +272,8 @@ def register_tools(mcp: FastMCP) -> None:
                 "disposition": Disposition.INLINE,
                 "format": Format.JSON_ARRAY,
                 "wait_timeout": "50s",
+                # Truncate server-side; the extra row tells us whether more exist
+                "row_limit": _MARKDOWN_MAX_ROWS + 1,
             }
             if catalog:
                 kwargs["catalog"] = catalog
@@ -196,9 +287,11 @@ def register_tools(mcp: FastMCP) -> None:
             if not result or not result.data_array:
                 return "Query returned no results."
 
+            # The manifest (column schema) lives on the response, not the result chunk
+            manifest = response.manifest
             columns = (
-                [col.name for col in result.manifest.schema.columns]
-                if result.manifest
+                [col.name for col in manifest.schema.columns]
+                if manifest and manifest.schema and manifest.schema.columns
                 else []
             )
             rows = result.data_array
@@ -206,21 +299,21 @@ def register_tools(mcp: FastMCP) -> None:
             if not columns:
                 return to_json(response)
 
-            # Build a markdown-formatted table
-            max_rows = 100
-            header = "| " + " | ".join(columns) + " |"
-            separator = "| " + " | ".join(["---"] * len(columns)) + " |"
-            body_rows = []
-            for row in rows[:max_rows]:
-                cells = [str(v) if v is not None else "NULL" for v in row]
-                body_rows.append("| " + " | ".join(cells) + " |")
-
-            table = "\n".join([header, separator, *body_rows])
+            # Build a markdown-formatted table in a single join
+            max_rows = _MARKDOWN_MAX_ROWS
+            lines = itertools.chain(
+                ("| " + " | ".join(columns) + " |", "|" + " --- |" * len(columns)),
+                (
+                    "| " + " | ".join(["NULL" if v is None else str(v) for v in row]) + " |"
+                    for row in itertools.islice(rows, max_rows)
+                ),
+            )
+            table = "\n".join(lines)
 
-            meta = f"\n\n*{len(rows)} rows returned"
             if len(rows) > max_rows:
-                meta += f" (showing first {max_rows})"
-            meta += "*"
+                meta = f"\n\n*More than {max_rows} rows returned (showing first {max_rows})*"
+            else:
+                meta = f"\n\n*{len(rows)} rows returned*"
 
             return table + meta
         except Exception as e:
@@ -240,34 +333,41 @@ def register_tools(mcp: FastMCP) -> None:
             if not warehouses:
                 return to_json({"error": "No SQL warehouses found in workspace. Create one first."})
 
-            # Prefer an already-running warehouse
+            # Prefer an already-running warehouse; remember the first stopped one
+            # on the same pass in case none is running
+            states = []
+            first_stopped = None
             for wh in warehouses:
-                state = str(getattr(wh, "state", "")).upper()
+                state = _state_name(getattr(wh, "state", None))
+                states.append(state)
                 if state == "RUNNING":
+                    remember_running_warehouse(w, wh.id)
                     return to_json({
                         "warehouse_id": wh.id,
                         "name": wh.name,
                         "state": "RUNNING",
                         "message": f"Warehouse '{wh.name}' is already running and ready for queries.",
                     })
-
-            # No running warehouse found; start the first stopped one
-            for wh in warehouses:
-                state = str(getattr(wh, "state", "")).upper()
-                if state in ("STOPPED", "STOPPING"):
-                    w.warehouses.start(id=wh.id)
-                    return to_json({
-                        "warehouse_id": wh.id,
-                        "name": wh.name,
-                        "state": "STARTING",
-                        "message": f"Starting warehouse '{wh.name}'. Check status with databricks_get_warehouse.",
-                    })
+                if first_stopped is None and state in ("STOPPED", "STOPPING"):
+                    first_stopped = wh
+
+            if first_stopped is not None:
+                w.warehouses.start(id=first_stopped.id)
+                return to_json({
+                    "warehouse_id": first_stopped.id,
+                    "name": first_stopped.name,
+                    "state": "STARTING",
+                    "message": (
+                        f"Starting warehouse '{first_stopped.name}'. "
+                        "Check status with databricks_get_warehouse."
+                    ),
+                })
 
             # All warehouses are in transitional states
             return to_json({
                 "warehouses": [
-                    {"id": wh.id, "name": wh.name, "state": str(getattr(wh, "state", "unknown"))}
-                    for wh in warehouses
+                    {"id": wh.id, "name": wh.name, "state": state or "UNKNOWN"}
+                    for wh, state in zip(warehouses, states)
                 ],
                 "message": "No startable warehouses found. All are in transitional states.",
             })
@@ -292,64 +392,35 @@ def register_tools(mcp: FastMCP) -> None:
             limit: Number of sample rows to return. Defaults to 10.
         """
         try:
-            from databricks.sdk.service.sql import Disposition, Format
-
             w = get_workspace_client()
-            result: dict = {"table_name": table_name}
 
             # Get table metadata (columns, types)
-            try:
-                table_info = w.tables.get(table_name)
-                if table_info.columns:
-                    result["columns"] = [
+            def table_metadata() -> dict:
+                try:
+                    table_info = w.tables.get(table_name)
+                except Exception:
+                    return {"metadata": "Could not retrieve table metadata"}
+                if not table_info.columns:
+                    return {}
+                return {
+                    "columns": [
                         {
                             "name": col.name,
-                            "type": str(
-                                getattr(col, "type_name", getattr(col, "type_text", "unknown"))
-                            ),
+                            "type": _state_name(getattr(col, "type_name", None))
+                            or getattr(col, "type_text", None)
+                            or "unknown",
                         }
                         for col in table_info.columns
-                    ]
-                    result["column_count"] = len(table_info.columns)
-            except Exception:
-                result["metadata"] = "Could not retrieve table metadata"
-
-            # Resolve a warehouse ID if the caller did not provide one
-            wh_id = warehouse_id
-            if not wh_id:
-                warehouses = list(w.warehouses.list())
-                for wh in warehouses:
-                    if str(getattr(wh, "state", "")).upper() == "RUNNING":
-                        wh_id = wh.id
-                        break
-
-            if not wh_id:
-                result["sample_data"] = (
-                    "No running SQL warehouse found. Provide a warehouse_id or start one."
-                )
-                return to_json(result)
-
-            # Query sample rows
-            response = w.statement_execution.execute_statement(
-                warehouse_id=wh_id,
-                statement=f"SELECT * FROM {table_name} LIMIT {limit}",
-                disposition=Disposition.INLINE,
-                format=Format.JSON_ARRAY,
-                wait_timeout="30s",
-            )
-            if response.result and response.result.data_array:
-                columns = (
-                    [col.name for col in response.result.manifest.schema.columns]
-                    if response.result.manifest
-                    else []
-                )
-                result["sample_data"] = {
-                    "columns": columns,
-                    "rows": response.result.data_array[:limit],
-                    "row_count": len(response.result.data_array),
+                    ],
+                    "column_count": len(table_info.columns),
                 }
-            else:
-                result["sample_data"] = "No data returned"
+
+            # Fetch metadata in the background while the warehouse is resolved
+            # and the sample query runs; the two are independent round trips
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                metadata = pool.submit(table_metadata)
+                sample_data = preview_sample(w, table_name, warehouse_id, limit)
+                result: dict = {"table_name": table_name, **metadata.result(), "sample_data": sample_data}
 
             return to_json(result)
         except Exception as e:
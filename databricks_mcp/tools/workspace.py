@@ -6,11 +6,16 @@ directories), importing/exporting notebooks, and managing Git repos.
 
 from __future__ import annotations
 
+from databricks.sdk.service.workspace import ExportFormat, ImportFormat, Language
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.config import get_workspace_client
 from databricks_mcp.utils import format_error, paginate, to_json
 
+# Resolved once at import so import_notebook validates with a dict lookup
+_IMPORT_FORMATS = {f.name: f for f in ImportFormat}
+_LANGUAGES = {lang.name: lang for lang in Language}
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register all workspace tools with the MCP server."""
@@ -88,15 +93,23 @@ def register_tools(mcp: FastMCP) -> None:
         Returns:
             Confirmation message on success.
         """
+        import_format = _IMPORT_FORMATS.get(format.upper())
+        if import_format is None:
+            return format_error(ValueError(
+                f"Invalid format '{format}'. Must be one of: {', '.join(sorted(_IMPORT_FORMATS))}."
+            ))
+        notebook_language = _LANGUAGES.get(language.upper())
+        if notebook_language is None:
+            return format_error(ValueError(
+                f"Invalid language '{language}'. Must be one of: {', '.join(sorted(_LANGUAGES))}."
+            ))
         try:
-            from databricks.sdk.service.workspace import ImportFormat, Language
-
             w = get_workspace_client()
             w.workspace.import_(
                 path=path,
                 content=content,
-                format=ImportFormat[format],
-                language=Language[language],
+                format=import_format,
+                language=notebook_language,
                 overwrite=overwrite,
             )
             return f"Notebook imported successfully to '{path}'."
@@ -119,8 +132,6 @@ def register_tools(mcp: FastMCP) -> None:
             and the notebook path.
         """
         try:
-            from databricks.sdk.service.workspace import ExportFormat
-
             w = get_workspace_client()
             result = w.workspace.export(path=path, format=ExportFormat.SOURCE)
             return to_json(result)
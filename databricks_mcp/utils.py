@@ -3,8 +3,65 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, is_dataclass
-from typing import Any, Iterator
+from dataclasses import fields, is_dataclass
+from enum import Enum, EnumMeta
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Callable, Iterator
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install databricks-sdk-mcp[fast]
+    orjson = None
+else:
+    # Dataclasses and datetimes go through serialize() so None fields are
+    # dropped and output matches the stdlib encoder path.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+# Leaf types returned unchanged; checked by exact type before any isinstance
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Sentinel for attributes that may legitimately be None
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return a dataclass type's field names, computed once per type."""
+    return tuple(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _field_getter(cls: type) -> Callable[[Any], tuple[Any, ...]]:
+    """Return a callable reading all of a dataclass type's fields as a tuple."""
+    names = _field_names(cls)
+    if len(names) > 1:
+        return attrgetter(*names)
+    # attrgetter with one name returns a bare value, and needs at least one
+    return lambda obj: tuple(getattr(obj, name) for name in names)
+
+
+def _serialize_dict(obj: dict) -> dict[Any, Any]:
+    return {k: serialize(v) for k, v in obj.items()}
+
+
+def _serialize_sequence(obj: list | tuple) -> list[Any]:
+    return [serialize(item) for item in obj]
+
+
+# Exact-type handlers for containers; subclasses fall through to isinstance
+_CONTAINER_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    dict: _serialize_dict,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+}
 
 
 def serialize(obj: Any) -> Any:
@@ -12,17 +69,28 @@ def serialize(obj: Any) -> Any:
 
     Handles nested dataclasses, lists, and enums.
     """
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
+    obj_type = type(obj)
+    if obj_type in _SCALAR_TYPES:
         return obj
+    handler = _CONTAINER_HANDLERS.get(obj_type)
+    if handler is not None:
+        return handler(obj)
+    if type(obj_type) is EnumMeta:  # plain enums, without an MRO walk
+        return obj.value
     if isinstance(obj, dict):
-        return {k: serialize(v) for k, v in obj.items()}
+        return _serialize_dict(obj)
     if isinstance(obj, (list, tuple)):
-        return [serialize(item) for item in obj]
+        return _serialize_sequence(obj)
     if is_dataclass(obj) and not isinstance(obj, type):
-        return {k: serialize(v) for k, v in asdict(obj).items() if v is not None}
-    if hasattr(obj, "value"):  # Enum
+        # Read fields directly: asdict() would deep-copy the whole tree only
+        # for this function to walk it a second time.
+        values = zip(_field_names(obj_type), _field_getter(obj_type)(obj))
+        return {k: serialize(v) for k, v in values if v is not None}
+    if isinstance(obj, Enum):  # enums with a custom metaclass
+        return obj.value
+    if isinstance(obj, (str, int, float, bool)):
+        return obj
+    if hasattr(obj, "value"):  # Enum-like
         return obj.value
     if hasattr(obj, "__dict__"):
         return {k: serialize(v) for k, v in obj.__dict__.items() if not k.startswith("_") and v is not None}
@@ -39,38 +107,89 @@ def paginate(iterator: Iterator[Any], max_items: int = 100) -> list[dict[str, An
     Returns:
         List of serialized items
     """
-    results = []
-    for i, item in enumerate(iterator):
-        if i >= max_items:
-            break
-        results.append(serialize(item))
-    return results
+    # islice stops before pulling item max_items + 1, so the SDK never
+    # fetches a further page just to discover the limit was reached.
+    return [serialize(item) for item in islice(iterator, max(max_items, 0))]
 
 
 def truncate_results(items: list[Any], max_items: int = 50) -> dict[str, Any]:
     """Wrap results with truncation info.
 
-    Returns a dict with 'items', 'count', and 'truncated' fields.
+    Returns a dict with 'items', 'count', and 'truncated' fields. When
+    nothing is cut, 'items' is the input list itself rather than a copy.
     """
-    truncated = len(items) > max_items
+    count = len(items)
+    truncated = count > max_items
     return {
-        "items": items[:max_items],
-        "count": len(items),
+        "items": items[:max_items] if truncated else items,
+        "count": count,
         "truncated": truncated,
     }
 
 
-def format_error(e: Exception) -> str:
+class ErrorMessage(str):
+    """A tool response produced by ``format_error``.
+
+    Behaves as a plain string; the type only lets callers such as the
+    response cache tell failures apart from results.
+    """
+
+    __slots__ = ()
+
+
+def format_error(e: Exception) -> ErrorMessage:
     """Format SDK exceptions into consistent error messages."""
     error_type = type(e).__name__
     message = str(e)
 
     # Extract useful info from Databricks API errors
-    if hasattr(e, "error_code"):
-        return f"{error_type}: [{e.error_code}] {message}"
-    return f"{error_type}: {message}"
+    error_code = getattr(e, "error_code", _MISSING)
+    if error_code is not _MISSING:
+        return ErrorMessage(f"{error_type}: [{error_code}] {message}")
+    return ErrorMessage(f"{error_type}: {message}")
+
+
+def from_json(text: str) -> Any:
+    """Parse a JSON string argument, using orjson when installed.
+
+    Input orjson rejects (e.g. NaN literals or integers beyond 64 bits) is
+    re-parsed with the stdlib so behaviour matches ``json.loads``. Invalid
+    JSON raises ``json.JSONDecodeError`` either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encoder hook: serialize values the JSON encoder cannot handle natively."""
+    data = serialize(obj)
+    if data is None or isinstance(data, (str, int, float, bool, dict, list)):
+        return data
+    # e.g. an enum-like object whose .value is itself unencodable
+    return str(data)
+
+
+# Built once: json.dumps() with non-default options constructs a new encoder
+# per call. ensure_ascii=False emits UTF-8 text as-is, like orjson does.
+_JSON_ENCODER = json.JSONEncoder(indent=2, default=_json_default, ensure_ascii=False)
 
 
 def to_json(obj: Any) -> str:
-    """Serialize an object to a formatted JSON string."""
-    return json.dumps(serialize(obj), indent=2, default=str)
+    """Serialize an object to a formatted JSON string.
+
+    Dicts, lists and primitives are encoded natively; ``serialize`` is only
+    called for values the encoder cannot handle (SDK dataclasses, enums,
+    plain objects), so already-serialized results are not walked twice.
+    Uses the orjson C encoder when installed, falling back to the stdlib
+    encoder for payloads orjson rejects (e.g. integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return _JSON_ENCODER.encode(obj)
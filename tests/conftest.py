@@ -1,10 +1,12 @@
 """Shared test fixtures for Databricks MCP server tests."""
 
+import typing
 from contextlib import ExitStack
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
+from databricks.sdk import WorkspaceClient
 from mcp.server.fastmcp import FastMCP
 
 # Every module that does ``from databricks_mcp.config import get_workspace_client``
@@ -29,102 +31,113 @@ _MODULES_USING_GET_WORKSPACE_CLIENT = [
     "databricks_mcp.tools.connections",
     "databricks_mcp.tools.experiments",
     "databricks_mcp.tools.sharing",
+    "databricks_mcp.tools.workflows",
     "databricks_mcp.resources.workspace_info",
 ]
 
 
+def _autospec_service(name: str) -> MagicMock:
+    """Autospec the API class that ``WorkspaceClient.<name>`` returns."""
+    api_cls = typing.get_type_hints(getattr(WorkspaceClient, name).fget)["return"]
+    return create_autospec(api_cls, instance=True)
+
+
 @pytest.fixture
 def mcp():
     """Create a fresh FastMCP instance for testing."""
     return FastMCP("test-databricks")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_workspace_client():
     """Create a mock WorkspaceClient with all service attributes.
 
+    The client and each service are specced against the SDK, so a tool calling
+    a method the SDK does not have fails instead of silently passing.
+    Autospeccing runs once per session; ``patched_client`` resets it before each test.
+
     Each attribute is a MagicMock that can be inspected for calls made by
     tool functions.  Services listed here cover every tool module in
     ``databricks_mcp/tools/``.
     """
-    client = MagicMock()
+    client = MagicMock(spec_set=WorkspaceClient)
 
     # Unity Catalog
-    client.catalogs = MagicMock()
-    client.schemas = MagicMock()
-    client.tables = MagicMock()
-    client.volumes = MagicMock()
-    client.functions = MagicMock()
-    client.registered_models = MagicMock()
+    client.catalogs = _autospec_service("catalogs")
+    client.schemas = _autospec_service("schemas")
+    client.tables = _autospec_service("tables")
+    client.volumes = _autospec_service("volumes")
+    client.functions = _autospec_service("functions")
+    client.registered_models = _autospec_service("registered_models")
 
     # SQL
-    client.warehouses = MagicMock()
-    client.statement_execution = MagicMock()
-    client.queries = MagicMock()
-    client.alerts = MagicMock()
-    client.query_history = MagicMock()
+    client.warehouses = _autospec_service("warehouses")
+    client.statement_execution = _autospec_service("statement_execution")
+    client.queries = _autospec_service("queries")
+    client.alerts = _autospec_service("alerts")
+    client.query_history = _autospec_service("query_history")
 
     # Workspace
-    client.workspace = MagicMock()
-    client.repos = MagicMock()
+    client.workspace = _autospec_service("workspace")
+    client.repos = _autospec_service("repos")
 
     # Compute
-    client.clusters = MagicMock()
-    client.instance_pools = MagicMock()
-    client.cluster_policies = MagicMock()
+    client.clusters = _autospec_service("clusters")
+    client.instance_pools = _autospec_service("instance_pools")
+    client.cluster_policies = _autospec_service("cluster_policies")
 
     # Jobs & Pipelines
-    client.jobs = MagicMock()
-    client.pipelines = MagicMock()
+    client.jobs = _autospec_service("jobs")
+    client.pipelines = _autospec_service("pipelines")
 
     # Serving & ML
-    client.serving_endpoints = MagicMock()
-    client.model_versions = MagicMock()
-    client.vector_search_endpoints = MagicMock()
-    client.vector_search_indexes = MagicMock()
+    client.serving_endpoints = _autospec_service("serving_endpoints")
+    client.model_versions = _autospec_service("model_versions")
+    client.vector_search_endpoints = _autospec_service("vector_search_endpoints")
+    client.vector_search_indexes = _autospec_service("vector_search_indexes")
 
     # Apps & Database (Lakebase)
-    client.apps = MagicMock()
-    client.database = MagicMock()
+    client.apps = _autospec_service("apps")
+    client.database = _autospec_service("database")
 
     # Dashboards
-    client.lakeview = MagicMock()
+    client.lakeview = _autospec_service("lakeview")
 
     # Genie
-    client.genie = MagicMock()
+    client.genie = _autospec_service("genie")
 
     # Secrets
-    client.secrets = MagicMock()
+    client.secrets = _autospec_service("secrets")
 
     # IAM
-    client.users = MagicMock()
-    client.groups = MagicMock()
-    client.service_principals = MagicMock()
-    client.permissions = MagicMock()
+    client.users = _autospec_service("users")
+    client.groups = _autospec_service("groups")
+    client.service_principals = _autospec_service("service_principals")
+    client.permissions = _autospec_service("permissions")
 
     # Connections
-    client.connections = MagicMock()
+    client.connections = _autospec_service("connections")
 
     # Experiments (MLflow)
-    client.experiments = MagicMock()
+    client.experiments = _autospec_service("experiments")
 
     # Delta Sharing
-    client.shares = MagicMock()
-    client.recipients = MagicMock()
-    client.providers = MagicMock()
+    client.shares = _autospec_service("shares")
+    client.recipients = _autospec_service("recipients")
+    client.providers = _autospec_service("providers")
 
     # Workspace info resource
-    client.current_user = MagicMock()
-    client.config = MagicMock()
+    client.current_user = _autospec_service("current_user")
+    client.config = _autospec_service("config")
     client.config.host = "https://test.databricks.com"
     client.config.auth_type = "pat"
 
     return client
 
 
-@pytest.fixture
-def patched_client(mock_workspace_client):
-    """Patch ``get_workspace_client`` everywhere it is imported.
+@pytest.fixture(scope="module")
+def _patched_workspace_client(mock_workspace_client):
+    """Patch ``get_workspace_client`` everywhere it is imported, once per module.
 
     Because each tool module does ``from databricks_mcp.config import
     get_workspace_client``, patching only the config module is insufficient --
@@ -140,3 +153,15 @@ def patched_client(mock_workspace_client):
                 )
             )
         yield mock_workspace_client
+
+
+@pytest.fixture
+def patched_client(_patched_workspace_client):
+    """The patched mock client, with calls, return values and side effects reset.
+
+    The mock tree is shared across the session and the patches across a test
+    module; resetting per test gives each test a clean client without
+    rebuilding either.
+    """
+    _patched_workspace_client.reset_mock(return_value=True, side_effect=True)
+    return _patched_workspace_client
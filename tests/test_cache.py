@@ -0,0 +1,176 @@
+"""Tests for databricks_mcp.cache — ResponseCache and read-only tool detection."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from databricks_mcp.cache import ResponseCache, is_cacheable_tool, is_read_only_tool, is_read_statement
+from databricks_mcp.utils import format_error
+
+
+class TestIsReadOnlyTool:
+    """Verify tool-name classification."""
+
+    def test_get_and_list_are_read_only(self) -> None:
+        assert is_read_only_tool("databricks_get_cluster") is True
+        assert is_read_only_tool("databricks_list_jobs") is True
+
+    def test_writes_are_not_read_only(self) -> None:
+        assert is_read_only_tool("databricks_create_cluster") is False
+        assert is_read_only_tool("databricks_execute_sql") is False
+
+    def test_reads_without_get_or_list_prefix(self) -> None:
+        assert is_read_only_tool("databricks_workspace_status") is True
+        assert is_cacheable_tool("databricks_dbfs_list") is True
+        assert is_cacheable_tool("databricks_tool_guide") is True
+        assert is_read_only_tool("databricks_validate_storage_credential") is True
+
+    @pytest.mark.parametrize(
+        "name", ["databricks_get_statement_status", "databricks_get_run", "databricks_get_cluster"]
+    )
+    def test_polling_tools_are_not_cacheable(self, name: str) -> None:
+        assert is_read_only_tool(name) is True
+        assert is_cacheable_tool(name) is False
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            ("SELECT 1", True),
+            ("  show tables", True),
+            ("DESCRIBE TABLE t", True),
+            ("INSERT INTO t VALUES (1)", False),
+            ("WITH s AS (SELECT 1) INSERT INTO t SELECT * FROM s", False),
+            ("SELECTION", False),
+        ],
+    )
+    def test_read_statement(self, sql: str, expected: bool) -> None:
+        assert is_read_statement(sql) is expected
+
+
+class TestResponseCache:
+    """Verify TTL, LRU eviction, and write invalidation."""
+
+    def test_read_tool_cached_per_arguments(self) -> None:
+        cache = ResponseCache(ttl=60)
+        fn = MagicMock(side_effect=lambda **kw: f"result-{kw['name']}")
+        fn.__name__ = "databricks_get_catalog"
+        wrapped = cache.wrap("databricks_get_catalog", fn)
+
+        assert wrapped(name="a") == "result-a"
+        assert wrapped(name="a") == "result-a"
+        assert wrapped(name="b") == "result-b"
+        assert fn.call_count == 2
+
+    def test_error_responses_not_cached(self) -> None:
+        cache = ResponseCache(ttl=60)
+        fn = MagicMock(side_effect=[format_error(RuntimeError("429 Too Many Requests")), "catalogs"])
+        fn.__name__ = "databricks_list_catalogs"
+        wrapped = cache.wrap("databricks_list_catalogs", fn)
+
+        assert wrapped() == "RuntimeError: 429 Too Many Requests"
+        assert wrapped() == "catalogs"
+        assert wrapped() == "catalogs"
+        assert fn.call_count == 2
+
+    def test_polling_tool_neither_cached_nor_invalidating(self) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.put(("k",), "v")
+        fn = MagicMock(side_effect=["PENDING", "SUCCEEDED"])
+        fn.__name__ = "databricks_get_statement_status"
+        wrapped = cache.wrap("databricks_get_statement_status", fn)
+
+        assert wrapped(statement_id="s") == "PENDING"
+        assert wrapped(statement_id="s") == "SUCCEEDED"
+        assert cache.get(("k",)) == "v"
+
+    @pytest.mark.parametrize(
+        ("name", "kwargs", "invalidates"),
+        [
+            ("databricks_execute_sql", {"statement": "SELECT 1"}, False),
+            ("databricks_execute_sql", {"statement": "DROP TABLE t"}, True),
+            ("databricks_execute_sql", {"statement": "WITH s AS (SELECT 1) INSERT INTO t SELECT * FROM s"}, True),
+            ("databricks_query_as_markdown", {"sql": "SHOW SCHEMAS"}, False),
+            ("databricks_execute_sql_batch", {"statements": '["SHOW TABLES", "SELECT 1"]'}, False),
+            ("databricks_execute_sql_batch", {"statements": '["SELECT 1", "CREATE SCHEMA s"]'}, True),
+            ("databricks_execute_sql_batch", {"statements": "not json"}, True),
+        ],
+    )
+    def test_sql_tools_invalidate_only_for_writes(self, name: str, kwargs: dict, invalidates: bool) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.put(("k",), "v")
+        fn = MagicMock(return_value="ok")
+        fn.__name__ = name
+        wrapped = cache.wrap(name, fn)
+
+        assert wrapped(warehouse_id="wh", **kwargs) == "ok"
+        assert (cache.get(("k",)) is None) is invalidates
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = ResponseCache(ttl=5)
+        with patch("databricks_mcp.cache.time.monotonic", return_value=100.0):
+            cache.put(("k",), "v")
+            assert cache.get(("k",)) == "v"
+        with patch("databricks_mcp.cache.time.monotonic", return_value=105.0):
+            assert cache.get(("k",)) is None
+
+    def test_lru_eviction(self) -> None:
+        cache = ResponseCache(ttl=60, maxsize=2)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        cache.get(("a",))
+        cache.put(("c",), 3)
+        assert cache.get(("a",)) == 1
+        assert cache.get(("b",)) is None
+        assert cache.get(("c",)) == 3
+
+    def test_read_overlapping_write_is_not_stored(self) -> None:
+        """A read fetched before a concurrent write must not outlive that write's invalidation."""
+        cache = ResponseCache(ttl=60)
+        fetched, resume = threading.Event(), threading.Event()
+        state = {"value": "old"}
+
+        def read() -> str:
+            value = state["value"]
+            fetched.set()
+            resume.wait(timeout=5)
+            return value
+
+        def write() -> str:
+            state["value"] = "new"
+            return "updated"
+
+        wrapped_read = cache.wrap("databricks_get_catalog", read)
+        wrapped_write = cache.wrap("databricks_update_catalog", write)
+
+        reader = threading.Thread(target=wrapped_read)
+        reader.start()
+        assert fetched.wait(timeout=5)
+        assert wrapped_write() == "updated"
+        resume.set()
+        reader.join(timeout=5)
+
+        assert wrapped_read() == "new"
+
+    def test_write_tool_clears_cache(self) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.put(("databricks_list_clusters", (), ()), "cached")
+        write = MagicMock(return_value="created")
+        write.__name__ = "databricks_create_cluster"
+        wrapped = cache.wrap("databricks_create_cluster", write)
+
+        assert wrapped(cluster_name="x") == "created"
+        assert cache.get(("databricks_list_clusters", (), ())) is None
+
+    def test_write_tool_clears_cache_on_exception(self) -> None:
+        cache = ResponseCache(ttl=60)
+        cache.put(("k",), "v")
+        write = MagicMock(side_effect=RuntimeError("boom"))
+        write.__name__ = "databricks_delete_job"
+        wrapped = cache.wrap("databricks_delete_job", write)
+
+        try:
+            wrapped(job_id=1)
+        except RuntimeError:
+            pass
+        assert cache.get(("k",)) is None
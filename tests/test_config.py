@@ -1,77 +1,179 @@
-"""Tests for databricks_mcp.config — get_tool_filter() and is_module_enabled()."""
+"""Tests for databricks_mcp.config — client, pool size, cache TTL, warmup and tool-filter settings."""
 
-import os
 from unittest.mock import patch
 
 import pytest
 
-from databricks_mcp.config import get_tool_filter, is_module_enabled
+from databricks_mcp.config import (
+    get_cache_ttl,
+    get_http_pool_size,
+    get_tool_filter,
+    get_workspace_client,
+    is_module_enabled,
+    is_warmup_enabled,
+)
+
+
+_CONFIG_ENV_VARS = (
+    "DATABRICKS_MCP_HTTP_POOL_SIZE",
+    "DATABRICKS_MCP_CACHE_TTL",
+    "DATABRICKS_MCP_WARMUP",
+    "DATABRICKS_MCP_TOOLS_INCLUDE",
+    "DATABRICKS_MCP_TOOLS_EXCLUDE",
+)
+
+
+@pytest.fixture
+def config_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Unset the server's own env vars; tests set what they need on the returned monkeypatch.
+
+    Only these keys are touched, rather than snapshotting and clearing the
+    whole environment per test.
+    """
+    for name in _CONFIG_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+# ---------------------------------------------------------------------------
+# get_workspace_client()
+# ---------------------------------------------------------------------------
+
+class TestGetWorkspaceClient:
+    """Verify the WorkspaceClient is built once per process."""
+
+    def test_client_constructed_once(self) -> None:
+        """Repeated calls reuse the first client instead of re-resolving auth."""
+        get_workspace_client.cache_clear()
+        try:
+            with patch("databricks_mcp.config.WorkspaceClient") as mock_cls, \
+                    patch("databricks_mcp.config.Config") as mock_config:
+                first = get_workspace_client()
+                second = get_workspace_client()
+                assert first is second
+                mock_cls.assert_called_once_with(config=mock_config.return_value)
+        finally:
+            get_workspace_client.cache_clear()
+
+    def test_pool_sized_from_env(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_HTTP_POOL_SIZE", "8")
+        get_workspace_client.cache_clear()
+        try:
+            with patch("databricks_mcp.config.WorkspaceClient"), \
+                    patch("databricks_mcp.config.Config") as mock_config:
+                get_workspace_client()
+                mock_config.assert_called_once_with(max_connection_pools=8, max_connections_per_pool=8)
+        finally:
+            get_workspace_client.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# get_http_pool_size()
+# ---------------------------------------------------------------------------
+
+class TestGetHttpPoolSize:
+    """Verify the HTTP connection pool size knob."""
+
+    def test_default(self, config_env: pytest.MonkeyPatch) -> None:
+        assert get_http_pool_size() == 50
+
+    def test_custom_value(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_HTTP_POOL_SIZE", "100")
+        assert get_http_pool_size() == 100
+
+    def test_clamped_to_one(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_HTTP_POOL_SIZE", "0")
+        assert get_http_pool_size() == 1
+
+    def test_invalid_falls_back_to_default(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_HTTP_POOL_SIZE", "many")
+        assert get_http_pool_size() == 50
+
+
+# ---------------------------------------------------------------------------
+# get_cache_ttl()
+# ---------------------------------------------------------------------------
+
+class TestGetCacheTtl:
+    """Verify the response-cache TTL environment knob."""
+
+    def test_default(self, config_env: pytest.MonkeyPatch) -> None:
+        assert get_cache_ttl() == 3.0
+
+    def test_custom_value(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_CACHE_TTL", "10")
+        assert get_cache_ttl() == 10.0
+
+    def test_zero_disables(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_CACHE_TTL", "0")
+        assert get_cache_ttl() == 0.0
+
+    def test_invalid_falls_back_to_default(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_CACHE_TTL", "soon")
+        assert get_cache_ttl() == 3.0
+
+
+# ---------------------------------------------------------------------------
+# is_warmup_enabled()
+# ---------------------------------------------------------------------------
+
+class TestIsWarmupEnabled:
+    """Verify the startup warmup opt-in."""
+
+    def test_disabled_by_default(self, config_env: pytest.MonkeyPatch) -> None:
+        assert is_warmup_enabled() is False
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_enabled_values(self, config_env: pytest.MonkeyPatch, value: str) -> None:
+        config_env.setenv("DATABRICKS_MCP_WARMUP", value)
+        assert is_warmup_enabled() is True
+
+    def test_other_values_disabled(self, config_env: pytest.MonkeyPatch) -> None:
+        config_env.setenv("DATABRICKS_MCP_WARMUP", "0")
+        assert is_warmup_enabled() is False
 
 
 # ---------------------------------------------------------------------------
 # get_tool_filter()
 # ---------------------------------------------------------------------------
 
+_INCLUDE = "DATABRICKS_MCP_TOOLS_INCLUDE"
+_EXCLUDE = "DATABRICKS_MCP_TOOLS_EXCLUDE"
+
+
 class TestGetToolFilter:
     """Verify environment-based tool filtering logic."""
 
-    def test_no_env_vars_returns_none_none(self) -> None:
-        """When neither INCLUDE nor EXCLUDE is set, both are None."""
-        with patch.dict(os.environ, {}, clear=True):
-            include, exclude = get_tool_filter()
-            assert include is None
-            assert exclude is None
-
-    def test_include_only(self) -> None:
-        """INCLUDE env var parses comma-separated module names."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_INCLUDE": "sql,compute,jobs"}, clear=True):
-            include, exclude = get_tool_filter()
-            assert include == {"sql", "compute", "jobs"}
-            assert exclude is None
-
-    def test_exclude_only(self) -> None:
-        """EXCLUDE env var parses comma-separated module names."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_EXCLUDE": "genie,sharing"}, clear=True):
-            include, exclude = get_tool_filter()
-            assert include is None
-            assert exclude == {"genie", "sharing"}
-
-    def test_include_takes_precedence_over_exclude(self) -> None:
-        """When both INCLUDE and EXCLUDE are set, INCLUDE wins and EXCLUDE is cleared."""
-        env = {
-            "DATABRICKS_MCP_TOOLS_INCLUDE": "sql",
-            "DATABRICKS_MCP_TOOLS_EXCLUDE": "compute",
-        }
-        with patch.dict(os.environ, env, clear=True):
-            include, exclude = get_tool_filter()
-            assert include == {"sql"}
-            assert exclude is None
-
-    def test_whitespace_trimmed(self) -> None:
-        """Leading/trailing whitespace in comma-separated values is stripped."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_INCLUDE": " sql , compute "}, clear=True):
-            include, _ = get_tool_filter()
-            assert include == {"sql", "compute"}
-
-    def test_empty_string_returns_none(self) -> None:
-        """An empty INCLUDE value produces None, not an empty set."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_INCLUDE": ""}, clear=True):
-            include, exclude = get_tool_filter()
-            assert include is None
-            assert exclude is None
-
-    def test_empty_exclude_returns_none(self) -> None:
-        """An empty EXCLUDE value produces None, not an empty set."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_EXCLUDE": ""}, clear=True):
-            include, exclude = get_tool_filter()
-            assert include is None
-            assert exclude is None
-
-    def test_trailing_comma_ignored(self) -> None:
-        """Trailing commas don't produce empty-string entries."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_INCLUDE": "sql,compute,"}, clear=True):
-            include, _ = get_tool_filter()
-            assert include == {"sql", "compute"}
+    @pytest.mark.parametrize(
+        "env, expected_include, expected_exclude",
+        [
+            ({}, None, None),
+            ({_INCLUDE: "sql,compute,jobs"}, {"sql", "compute", "jobs"}, None),
+            ({_EXCLUDE: "genie,sharing"}, None, {"genie", "sharing"}),
+            # INCLUDE wins and EXCLUDE is cleared
+            ({_INCLUDE: "sql", _EXCLUDE: "compute"}, {"sql"}, None),
+            ({_INCLUDE: " sql , compute "}, {"sql", "compute"}, None),
+            # Empty values produce None, not an empty set
+            ({_INCLUDE: ""}, None, None),
+            ({_EXCLUDE: ""}, None, None),
+            # Trailing commas don't produce empty-string entries
+            ({_INCLUDE: "sql,compute,"}, {"sql", "compute"}, None),
+        ],
+        ids=[
+            "no_env", "include_only", "exclude_only", "include_over_exclude",
+            "whitespace_trimmed", "empty_include", "empty_exclude", "trailing_comma",
+        ],
+    )
+    def test_filter(
+        self,
+        config_env: pytest.MonkeyPatch,
+        env: dict[str, str],
+        expected_include: set[str] | None,
+        expected_exclude: set[str] | None,
+    ) -> None:
+        for key, value in env.items():
+            config_env.setenv(key, value)
+        assert get_tool_filter() == (expected_include, expected_exclude)
 
 
 # ---------------------------------------------------------------------------
@@ -81,37 +183,26 @@ class TestGetToolFilter:
 class TestIsModuleEnabled:
     """Verify per-module enablement checks."""
 
-    def test_all_enabled_by_default(self) -> None:
-        """No filters means every module is enabled."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert is_module_enabled("sql") is True
-            assert is_module_enabled("compute") is True
-            assert is_module_enabled("anything") is True
-
-    def test_include_filter_allows_listed(self) -> None:
-        """Only modules in the INCLUDE list are enabled."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_INCLUDE": "sql,compute"}, clear=True):
-            assert is_module_enabled("sql") is True
-            assert is_module_enabled("compute") is True
-            assert is_module_enabled("jobs") is False
-            assert is_module_enabled("genie") is False
-
-    def test_exclude_filter_blocks_listed(self) -> None:
-        """Modules in the EXCLUDE list are disabled; all others are enabled."""
-        with patch.dict(os.environ, {"DATABRICKS_MCP_TOOLS_EXCLUDE": "genie,sharing"}, clear=True):
-            assert is_module_enabled("genie") is False
-            assert is_module_enabled("sharing") is False
-            assert is_module_enabled("sql") is True
-            assert is_module_enabled("compute") is True
-
-    def test_include_overrides_exclude(self) -> None:
-        """When both filters are set, only INCLUDE matters."""
-        env = {
-            "DATABRICKS_MCP_TOOLS_INCLUDE": "sql",
-            "DATABRICKS_MCP_TOOLS_EXCLUDE": "sql",
-        }
-        with patch.dict(os.environ, env, clear=True):
-            # sql is in INCLUDE, so it's enabled despite also being in EXCLUDE
-            assert is_module_enabled("sql") is True
-            # compute is not in INCLUDE, so it's disabled
-            assert is_module_enabled("compute") is False
+    @pytest.mark.parametrize(
+        "env, module, expected",
+        [
+            # No filters means every module is enabled
+            ({}, "sql", True),
+            ({}, "anything", True),
+            ({_INCLUDE: "sql,compute"}, "compute", True),
+            ({_INCLUDE: "sql,compute"}, "jobs", False),
+            ({_EXCLUDE: "genie,sharing"}, "genie", False),
+            ({_EXCLUDE: "genie,sharing"}, "sql", True),
+            # When both filters are set, only INCLUDE matters
+            ({_INCLUDE: "sql", _EXCLUDE: "sql"}, "sql", True),
+            ({_INCLUDE: "sql", _EXCLUDE: "sql"}, "compute", False),
+        ],
+        ids=[
+            "default_sql", "default_any", "include_listed", "include_unlisted",
+            "exclude_listed", "exclude_unlisted", "include_overrides_exclude", "include_with_exclude_unlisted",
+        ],
+    )
+    def test_enabled(self, config_env: pytest.MonkeyPatch, env: dict[str, str], module: str, expected: bool) -> None:
+        for key, value in env.items():
+            config_env.setenv(key, value)
+        assert is_module_enabled(module) is expected
@@ -8,8 +8,11 @@ that by patching ``FastMCP`` before importing the server module.
 """
 
 import importlib
+import inspect
 import sys
-from types import ModuleType
+import threading
+from collections.abc import Iterator
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,6 +20,11 @@ import pytest
 from mcp.server.fastmcp import FastMCP
 
 
+# Stands in for every tool module in import-tracking tests; cheaper than
+# building a MagicMock per module and nothing inspects its calls.
+_STUB_TOOL_MODULE = SimpleNamespace(register_tools=lambda mcp: None)
+
+
 # ---------------------------------------------------------------------------
 # Helper: safely import the server module, patching FastMCP if needed
 # ---------------------------------------------------------------------------
@@ -44,6 +52,39 @@ def _import_server_fresh() -> ModuleType:
     return mod
 
 
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize ``tool_entry`` with one case per ``_TOOL_MODULES`` entry."""
+    if "tool_entry" in metafunc.fixturenames:
+        entries = _import_server_fresh()._TOOL_MODULES
+        metafunc.parametrize("tool_entry", entries, ids=[name for name, _ in entries])
+
+
+@pytest.fixture(scope="module")
+def server_mod() -> ModuleType:
+    """The server module, freshly imported once for this test module.
+
+    Tests only patch attributes on it within ``with`` blocks, so sharing one
+    import is safe; call ``_import_server_fresh()`` directly when a test
+    needs an isolated module.
+    """
+    return _import_server_fresh()
+
+
+@pytest.fixture(scope="module")
+def _shared_mcp() -> FastMCP:
+    return FastMCP("test")
+
+
+@pytest.fixture
+def blank_mcp(_shared_mcp: FastMCP) -> Iterator[FastMCP]:
+    """A FastMCP instance built once per module and emptied after each test."""
+    yield _shared_mcp
+    _shared_mcp._tool_manager._tools.clear()
+    _shared_mcp._resource_manager._resources.clear()
+    _shared_mcp._resource_manager._templates.clear()
+    _shared_mcp._prompt_manager._prompts.clear()
+
+
 # ---------------------------------------------------------------------------
 # _register_tools()
 # ---------------------------------------------------------------------------
@@ -51,12 +92,13 @@ def _import_server_fresh() -> ModuleType:
 class TestRegisterTools:
     """Verify that _register_tools() imports and registers tool modules."""
 
-    def test_registers_all_modules_when_no_filter(self) -> None:
+    def test_registers_all_modules_when_no_filter(
+        self, server_mod: ModuleType, blank_mcp: FastMCP, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """With no INCLUDE/EXCLUDE filters, all 17 tool modules are imported."""
-        server_mod = _import_server_fresh()
         tool_module_paths = {path for _, path in server_mod._TOOL_MODULES}
 
-        with patch.object(server_mod, "mcp", FastMCP("test")):
+        with patch.object(server_mod, "mcp", blank_mcp):
             with patch.object(server_mod, "is_module_enabled", return_value=True):
                 imported_tool_modules: list[str] = []
                 real_import = importlib.import_module
@@ -64,24 +106,23 @@ class TestRegisterTools:
                 def tracking_import(name: str) -> object:
                     if name in tool_module_paths:
                         imported_tool_modules.append(name)
-                        mod = MagicMock()
-                        mod.register_tools = MagicMock()
-                        return mod
+                        return _STUB_TOOL_MODULE
                     return real_import(name)
 
-                with patch("importlib.import_module", side_effect=tracking_import):
-                    server_mod._register_tools()
+                monkeypatch.setattr(importlib, "import_module", tracking_import)
+                server_mod._register_tools()
 
                 assert len(imported_tool_modules) == len(server_mod._TOOL_MODULES)
                 for _module_name, module_path in server_mod._TOOL_MODULES:
                     assert module_path in imported_tool_modules
 
-    def test_skips_disabled_modules(self) -> None:
+    def test_skips_disabled_modules(
+        self, server_mod: ModuleType, blank_mcp: FastMCP, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Modules that are disabled by the filter are not imported."""
-        server_mod = _import_server_fresh()
         tool_module_paths = {path for _, path in server_mod._TOOL_MODULES}
 
-        with patch.object(server_mod, "mcp", FastMCP("test")):
+        with patch.object(server_mod, "mcp", blank_mcp):
 
             def mock_enabled(name: str) -> bool:
                 return name == "sql"
@@ -93,23 +134,22 @@ class TestRegisterTools:
                 def tracking_import(name: str) -> object:
                     if name in tool_module_paths:
                         imported_tool_modules.append(name)
-                        mod = MagicMock()
-                        mod.register_tools = MagicMock()
-                        return mod
+                        return _STUB_TOOL_MODULE
                     return real_import(name)
 
-                with patch("importlib.import_module", side_effect=tracking_import):
-                    server_mod._register_tools()
+                monkeypatch.setattr(importlib, "import_module", tracking_import)
+                server_mod._register_tools()
 
                 assert len(imported_tool_modules) == 1
                 assert imported_tool_modules[0] == "databricks_mcp.tools.sql"
 
-    def test_handles_import_error_gracefully(self) -> None:
+    def test_handles_import_error_gracefully(
+        self, server_mod: ModuleType, blank_mcp: FastMCP, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """If a module fails to import, a warning is printed but execution continues."""
-        server_mod = _import_server_fresh()
         tool_module_paths = {path for _, path in server_mod._TOOL_MODULES}
 
-        with patch.object(server_mod, "mcp", FastMCP("test")):
+        with patch.object(server_mod, "mcp", blank_mcp):
             with patch.object(server_mod, "is_module_enabled", return_value=True):
                 real_import = importlib.import_module
 
@@ -118,16 +158,13 @@ class TestRegisterTools:
                         raise ImportError(f"No module named '{name}'")
                     return real_import(name)
 
-                with patch("importlib.import_module", side_effect=failing_import):
-                    # Should not raise -- errors are caught and printed as warnings
-                    server_mod._register_tools()
+                monkeypatch.setattr(importlib, "import_module", failing_import)
+                # Should not raise -- errors are caught and printed as warnings
+                server_mod._register_tools()
 
-    def test_always_registers_resources(self) -> None:
+    def test_always_registers_resources(self, server_mod: ModuleType, blank_mcp: FastMCP) -> None:
         """Resources are registered even when all tool modules are disabled."""
-        server_mod = _import_server_fresh()
-        test_mcp = FastMCP("test")
-
-        with patch.object(server_mod, "mcp", test_mcp):
+        with patch.object(server_mod, "mcp", blank_mcp):
             with patch.object(server_mod, "is_module_enabled", return_value=False):
                 mock_register = MagicMock()
                 with patch(
@@ -136,26 +173,115 @@ class TestRegisterTools:
                 ):
                     server_mod._register_tools()
 
-                mock_register.assert_called_once_with(test_mcp)
+                mock_register.assert_called_once_with(blank_mcp)
 
-    def test_module_without_register_tools_skipped(self) -> None:
+    def test_module_without_register_tools_skipped(
+        self, server_mod: ModuleType, blank_mcp: FastMCP, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """If a module lacks register_tools(), it is silently skipped."""
-        server_mod = _import_server_fresh()
         tool_module_paths = {path for _, path in server_mod._TOOL_MODULES}
 
-        with patch.object(server_mod, "mcp", FastMCP("test")):
+        with patch.object(server_mod, "mcp", blank_mcp):
             with patch.object(server_mod, "is_module_enabled", return_value=True):
                 real_import = importlib.import_module
 
                 def import_no_register(name: str) -> object:
                     if name in tool_module_paths:
                         # Return a module-like object that lacks register_tools
-                        return MagicMock(spec=[])
+                        return SimpleNamespace()
                     return real_import(name)
 
-                with patch("importlib.import_module", side_effect=import_no_register):
-                    # Should not raise
-                    server_mod._register_tools()
+                monkeypatch.setattr(importlib, "import_module", import_no_register)
+                # Should not raise
+                server_mod._register_tools()
+
+
+# ---------------------------------------------------------------------------
+# _ThreadedFastMCP
+# ---------------------------------------------------------------------------
+
+class TestThreadedFastMCP:
+    """Verify synchronous tools are offloaded to a worker thread."""
+
+    def test_sync_tool_registered_as_coroutine(self, server_mod: ModuleType) -> None:
+        server = server_mod._ThreadedFastMCP("test")
+
+        @server.tool()
+        def echo(value: int) -> str:
+            """Echo the value."""
+            return str(value)
+
+        tool = server._tool_manager.get_tool("echo")
+        assert inspect.iscoroutinefunction(tool.fn)
+        assert tool.description == "Echo the value."
+        assert set(tool.parameters["properties"]) == {"value"}
+
+    async def test_sync_tool_runs_off_event_loop_thread(self, server_mod: ModuleType) -> None:
+        server = server_mod._ThreadedFastMCP("test")
+        seen: list[int] = []
+
+        @server.tool()
+        def whoami() -> str:
+            seen.append(threading.get_ident())
+            return "ok"
+
+        await server.call_tool("whoami", {})
+        assert seen and seen[0] != threading.get_ident()
+
+    async def test_read_tools_use_response_cache(self, server_mod: ModuleType) -> None:
+        server = server_mod._ThreadedFastMCP("test")
+        server.response_cache = server_mod.ResponseCache(ttl=60)
+        calls: list[str] = []
+
+        @server.tool()
+        def databricks_list_things() -> str:
+            calls.append("list")
+            return "things"
+
+        @server.tool()
+        def databricks_create_thing() -> str:
+            calls.append("create")
+            return "created"
+
+        await server.call_tool("databricks_list_things", {})
+        await server.call_tool("databricks_list_things", {})
+        await server.call_tool("databricks_create_thing", {})
+        await server.call_tool("databricks_list_things", {})
+        assert calls == ["list", "create", "list"]
+
+
+# ---------------------------------------------------------------------------
+# _warmup()
+# ---------------------------------------------------------------------------
+
+class TestWarmup:
+    """Verify startup prefetching of common list tools."""
+
+    def test_calls_registered_warmup_tools_into_cache(self, server_mod: ModuleType) -> None:
+        server = server_mod._ThreadedFastMCP("test")
+        server.response_cache = server_mod.ResponseCache(ttl=60)
+        calls: list[str] = []
+
+        @server.tool()
+        def databricks_list_warehouses() -> str:
+            calls.append("warehouses")
+            return "[]"
+
+        with patch.object(server_mod, "mcp", server), \
+                patch.object(server_mod, "get_workspace_client"):
+            server_mod._warmup()
+
+        assert calls == ["warehouses"]
+        assert server.response_cache.get(("databricks_list_warehouses", (), ())) == "[]"
+
+    def test_auth_failure_skips_tools(self, server_mod: ModuleType) -> None:
+        server = MagicMock()
+
+        with patch.object(server_mod, "mcp", server), \
+                patch.object(server_mod, "get_workspace_client", side_effect=ValueError("no auth")):
+            server_mod._warmup()
+
+        server._tool_manager.get_tool.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -165,9 +291,8 @@ class TestRegisterTools:
 class TestMain:
     """Verify the main() entry point."""
 
-    def test_main_calls_register_and_run(self) -> None:
+    def test_main_calls_register_and_run(self, server_mod: ModuleType) -> None:
         """main() should call _register_tools() then mcp.run()."""
-        server_mod = _import_server_fresh()
         mock_mcp = MagicMock()
 
         with patch.object(server_mod, "mcp", mock_mcp):
@@ -178,6 +303,19 @@ class TestMain:
                     mock_register.assert_called_once()
                     mock_mcp.run.assert_called_once()
 
+    def test_main_starts_warmup_when_enabled(self, server_mod: ModuleType) -> None:
+
+        with patch.object(server_mod, "mcp", MagicMock()), \
+                patch.object(server_mod, "_register_tools"), \
+                patch.object(server_mod, "is_warmup_enabled", return_value=True), \
+                patch.object(server_mod.threading, "Thread") as mock_thread, \
+                patch("sys.argv", ["databricks-mcp"]):
+            server_mod.main()
+
+        mock_thread.assert_called_once()
+        assert mock_thread.call_args.kwargs["target"] is server_mod._warmup
+        mock_thread.return_value.start.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # _TOOL_MODULES constant
@@ -186,25 +324,14 @@ class TestMain:
 class TestToolModulesList:
     """Verify the module registry is complete and well-formed."""
 
-    def test_all_28_modules_listed(self) -> None:
-        server_mod = _import_server_fresh()
-        assert len(server_mod._TOOL_MODULES) == 28
-
-    def test_module_paths_match_names(self) -> None:
-        """Each module path should end with the module name."""
-        server_mod = _import_server_fresh()
-        for name, path in server_mod._TOOL_MODULES:
-            assert path.endswith(f".{name}"), f"Module path '{path}' doesn't end with '.{name}'"
-
-    def test_all_paths_start_with_package(self) -> None:
-        server_mod = _import_server_fresh()
-        for _, path in server_mod._TOOL_MODULES:
-            assert path.startswith("databricks_mcp.tools.")
+    def test_entry_shape(self, tool_entry: tuple[str, str]) -> None:
+        """Each module path is the package path followed by the module name."""
+        name, path = tool_entry
+        assert path == f"databricks_mcp.tools.{name}"
 
-    def test_expected_modules_present(self) -> None:
+    def test_expected_modules_present(self, server_mod: ModuleType) -> None:
         """All 28 expected module names are present in the list."""
-        server_mod = _import_server_fresh()
-        names = {name for name, _ in server_mod._TOOL_MODULES}
+        names = [name for name, _ in server_mod._TOOL_MODULES]
         expected = {
             "unity_catalog", "sql", "workspace", "compute", "jobs",
             "pipelines", "serving", "vector_search", "apps", "database",
@@ -214,4 +341,5 @@ class TestToolModulesList:
             "git_credentials", "quality_monitors", "command_execution",
             "workflows",
         }
-        assert names == expected
+        assert len(names) == 28
+        assert set(names) == expected
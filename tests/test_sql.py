@@ -5,11 +5,19 @@ saved queries, alerts, and query history.
 """
 
 import json
+from collections.abc import Callable
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from databricks.sdk.service.sql import (
+    CreateAlertRequestAlert,
+    CreateQueryRequestQuery,
+    Disposition,
+    Format,
+    QueryFilter,
+)
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.tools.sql import register_tools
@@ -19,51 +27,73 @@ from databricks_mcp.tools.sql import register_tools
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _get_tool_fn(mcp: FastMCP, name: str):
-    """Retrieve a registered tool's underlying function by name."""
-    tool = mcp._tool_manager.get_tool(name)
-    assert tool is not None, f"Tool '{name}' not found in registered tools"
-    return tool.fn
+# Shared read-only SDK response stub; patched_client resets the mock between tests
+_EMPTY_HISTORY = SimpleNamespace(res=[])
 
 
-def _tool_names(mcp: FastMCP) -> set[str]:
-    """Return the set of all registered tool names."""
-    return {t.name for t in mcp._tool_manager.list_tools()}
+def _tool_fns(mcp: FastMCP) -> dict[str, Callable[..., str]]:
+    """Map each registered tool name to its underlying function."""
+    return {t.name: t.fn for t in mcp._tool_manager.list_tools()}
+
+
+@pytest.fixture(scope="module")
+def sql_mcp() -> FastMCP:
+    """A FastMCP instance with the SQL tools registered once per module.
+
+    Tools resolve ``get_workspace_client`` when called, not when registered,
+    so each test's ``patched_client`` still applies to the shared instance.
+    """
+    mcp = FastMCP("test-databricks")
+    register_tools(mcp)
+    return mcp
+
+
+@pytest.fixture(scope="module")
+def tool_fns(sql_mcp: FastMCP) -> dict[str, Callable[..., str]]:
+    return _tool_fns(sql_mcp)
+
+
+@pytest.fixture(scope="module")
+def tool_names(tool_fns: dict[str, Callable[..., str]]) -> frozenset[str]:
+    """Names of all registered tools."""
+    return frozenset(tool_fns)
 
 
 # ---------------------------------------------------------------------------
 # Registration
 # ---------------------------------------------------------------------------
 
+_EXPECTED_TOOLS = frozenset({
+    # Warehouses
+    "databricks_list_warehouses",
+    "databricks_get_warehouse",
+    "databricks_create_warehouse",
+    "databricks_start_warehouse",
+    "databricks_stop_warehouse",
+    "databricks_delete_warehouse",
+    # Statement execution
+    "databricks_execute_sql",
+    "databricks_execute_sql_batch",
+    "databricks_get_statement_status",
+    "databricks_wait_for_statement",
+    "databricks_get_statement_result_chunk",
+    "databricks_cancel_statement",
+    # Queries
+    "databricks_list_queries",
+    "databricks_create_query",
+    # Alerts
+    "databricks_list_alerts",
+    "databricks_create_alert",
+    # History
+    "databricks_list_query_history",
+})
+
+
 class TestRegistration:
     """Verify register_tools() adds all expected SQL tools."""
 
-    def test_all_tools_registered(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        names = _tool_names(mcp)
-
-        expected = {
-            # Warehouses
-            "databricks_list_warehouses",
-            "databricks_get_warehouse",
-            "databricks_create_warehouse",
-            "databricks_start_warehouse",
-            "databricks_stop_warehouse",
-            "databricks_delete_warehouse",
-            # Statement execution
-            "databricks_execute_sql",
-            "databricks_get_statement_status",
-            "databricks_cancel_statement",
-            # Queries
-            "databricks_list_queries",
-            "databricks_create_query",
-            # Alerts
-            "databricks_list_alerts",
-            "databricks_create_alert",
-            # History
-            "databricks_list_query_history",
-        }
-        assert expected.issubset(names), f"Missing tools: {expected - names}"
+    def test_all_tools_registered(self, tool_names: frozenset[str]) -> None:
+        assert _EXPECTED_TOOLS <= tool_names, f"Missing tools: {_EXPECTED_TOOLS - tool_names}"
 
 
 # ---------------------------------------------------------------------------
@@ -74,31 +104,29 @@ class TestWarehouseTools:
     """Test SQL warehouse CRUD and lifecycle operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_warehouses(self) -> None:
-        self.client.warehouses.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_warehouses")
+        self.client.warehouses.list.return_value = ()
+        fn = self.tool_fns["databricks_list_warehouses"]
         result = fn()
         self.client.warehouses.list.assert_called_once()
-        parsed = json.loads(result)
-        assert parsed == []
+        assert result == "[]"
 
     def test_get_warehouse(self) -> None:
         mock_wh = SimpleNamespace(id="abc123", name="dev-warehouse", state="RUNNING")
         self.client.warehouses.get.return_value = mock_wh
-        fn = _get_tool_fn(self.mcp, "databricks_get_warehouse")
-        result = fn(id="abc123")
+        fn = self.tool_fns["databricks_get_warehouse"]
+        fn(id="abc123")
         self.client.warehouses.get.assert_called_once_with("abc123")
 
     def test_create_warehouse_defaults(self) -> None:
         mock_result = SimpleNamespace(id="new-wh", name="test-wh")
         self.client.warehouses.create.return_value = mock_result
-        fn = _get_tool_fn(self.mcp, "databricks_create_warehouse")
-        result = fn(name="test-wh")
+        fn = self.tool_fns["databricks_create_warehouse"]
+        fn(name="test-wh")
         self.client.warehouses.create.assert_called_once_with(
             name="test-wh",
             cluster_size="2X-Small",
@@ -109,8 +137,8 @@ class TestWarehouseTools:
     def test_create_warehouse_custom(self) -> None:
         mock_result = SimpleNamespace(id="new-wh", name="big-wh")
         self.client.warehouses.create.return_value = mock_result
-        fn = _get_tool_fn(self.mcp, "databricks_create_warehouse")
-        result = fn(name="big-wh", cluster_size="Large", max_num_clusters=5, auto_stop_mins=30)
+        fn = self.tool_fns["databricks_create_warehouse"]
+        fn(name="big-wh", cluster_size="Large", max_num_clusters=5, auto_stop_mins=30)
         self.client.warehouses.create.assert_called_once_with(
             name="big-wh",
             cluster_size="Large",
@@ -118,30 +146,25 @@ class TestWarehouseTools:
             auto_stop_mins=30,
         )
 
-    def test_start_warehouse(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_start_warehouse")
-        result = fn(id="wh-1")
-        self.client.warehouses.start.assert_called_once_with("wh-1")
-        assert "start initiated" in result
-
-    def test_stop_warehouse(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_stop_warehouse")
-        result = fn(id="wh-1")
-        self.client.warehouses.stop.assert_called_once_with("wh-1")
-        assert "stop initiated" in result
-
-    def test_delete_warehouse(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_delete_warehouse")
-        result = fn(id="wh-1")
-        self.client.warehouses.delete.assert_called_once_with("wh-1")
-        assert "deleted successfully" in result
+    @pytest.mark.parametrize(
+        "tool, method, phrase",
+        [
+            ("databricks_start_warehouse", "start", "start initiated"),
+            ("databricks_stop_warehouse", "stop", "stop initiated"),
+            ("databricks_delete_warehouse", "delete", "deleted successfully"),
+        ],
+        ids=["start", "stop", "delete"],
+    )
+    def test_lifecycle_action(self, tool: str, method: str, phrase: str) -> None:
+        result = self.tool_fns[tool](id="wh-1")
+        getattr(self.client.warehouses, method).assert_called_once_with("wh-1")
+        assert phrase in result
 
     def test_list_warehouses_error(self) -> None:
         self.client.warehouses.list.side_effect = RuntimeError("auth failed")
-        fn = _get_tool_fn(self.mcp, "databricks_list_warehouses")
+        fn = self.tool_fns["databricks_list_warehouses"]
         result = fn()
-        assert "RuntimeError" in result
-        assert "auth failed" in result
+        assert result == "RuntimeError: auth failed"
 
 
 # ---------------------------------------------------------------------------
@@ -152,9 +175,8 @@ class TestStatementExecutionTools:
     """Test SQL statement execution, status, and cancellation."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_execute_sql_minimal(self) -> None:
@@ -162,66 +184,139 @@ class TestStatementExecutionTools:
         mock_result = SimpleNamespace(status="SUCCEEDED", data=[[1, 2]])
         self.client.statement_execution.execute_statement.return_value = mock_result
 
-        fn = _get_tool_fn(self.mcp, "databricks_execute_sql")
+        fn = self.tool_fns["databricks_execute_sql"]
 
-        with patch("databricks.sdk.service.sql.Disposition") as MockDisp, \
-             patch("databricks.sdk.service.sql.Format") as MockFmt:
-            MockDisp.INLINE = "INLINE"
-            MockFmt.JSON_ARRAY = "JSON_ARRAY"
-            result = fn(warehouse_id="wh-1", statement="SELECT 1")
+        fn(warehouse_id="wh-1", statement="SELECT 1")
 
-        self.client.statement_execution.execute_statement.assert_called_once()
-        call_kwargs = self.client.statement_execution.execute_statement.call_args[1]
-        assert call_kwargs["warehouse_id"] == "wh-1"
-        assert call_kwargs["statement"] == "SELECT 1"
-        assert call_kwargs["wait_timeout"] == "50s"
-        # catalog and schema should NOT be in kwargs when empty
-        assert "catalog" not in call_kwargs
-        assert "schema" not in call_kwargs
+        # catalog and schema are omitted when empty
+        self.client.statement_execution.execute_statement.assert_called_once_with(
+            warehouse_id="wh-1",
+            statement="SELECT 1",
+            wait_timeout="50s",
+            disposition=Disposition.INLINE,
+            format=Format.JSON_ARRAY,
+        )
 
     def test_execute_sql_with_catalog_and_schema(self) -> None:
         """Execute SQL with optional catalog and schema."""
         mock_result = SimpleNamespace(status="SUCCEEDED")
         self.client.statement_execution.execute_statement.return_value = mock_result
 
-        fn = _get_tool_fn(self.mcp, "databricks_execute_sql")
+        fn = self.tool_fns["databricks_execute_sql"]
 
-        with patch("databricks.sdk.service.sql.Disposition") as MockDisp, \
-             patch("databricks.sdk.service.sql.Format") as MockFmt:
-            MockDisp.INLINE = "INLINE"
-            MockFmt.JSON_ARRAY = "JSON_ARRAY"
-            result = fn(
-                warehouse_id="wh-1",
-                statement="SELECT * FROM t",
-                catalog="my_cat",
-                schema="my_sch",
-            )
+        fn(
+            warehouse_id="wh-1",
+            statement="SELECT * FROM t",
+            catalog="my_cat",
+            schema="my_sch",
+        )
 
-        call_kwargs = self.client.statement_execution.execute_statement.call_args[1]
-        assert call_kwargs["catalog"] == "my_cat"
-        assert call_kwargs["schema"] == "my_sch"
+        call_kwargs = self.client.statement_execution.execute_statement.call_args.kwargs
+        assert {"catalog": "my_cat", "schema": "my_sch"}.items() <= call_kwargs.items()
 
     def test_execute_sql_error(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_execute_sql")
-        with patch("databricks.sdk.service.sql.Disposition") as MockDisp, \
-             patch("databricks.sdk.service.sql.Format") as MockFmt:
-            MockDisp.INLINE = "INLINE"
-            MockFmt.JSON_ARRAY = "JSON_ARRAY"
-            self.client.statement_execution.execute_statement.side_effect = RuntimeError("warehouse not found")
-            result = fn(warehouse_id="bad", statement="SELECT 1")
+        fn = self.tool_fns["databricks_execute_sql"]
+        self.client.statement_execution.execute_statement.side_effect = RuntimeError("warehouse not found")
+        result = fn(warehouse_id="bad", statement="SELECT 1")
 
-        assert "RuntimeError" in result
-        assert "warehouse not found" in result
+        assert result == "RuntimeError: warehouse not found"
+
+    def test_execute_sql_does_not_cache_metadata(self) -> None:
+        """SHOW/DESCRIBE always reach the warehouse, so UC writes are never masked."""
+        self.client.statement_execution.execute_statement.return_value = SimpleNamespace(
+            status=SimpleNamespace(state="SUCCEEDED")
+        )
+        fn = self.tool_fns["databricks_execute_sql"]
+        fn(warehouse_id="wh-1", statement="SHOW SCHEMAS")
+        fn(warehouse_id="wh-1", statement="SHOW SCHEMAS")
+        assert self.client.statement_execution.execute_statement.call_count == 2
+
+    def test_execute_sql_batch(self) -> None:
+        """Each statement is executed and results keep the input order."""
+        self.client.statement_execution.execute_statement.side_effect = (
+            lambda statement, **kw: SimpleNamespace(statement_id=f"id-{statement}")
+        )
+        fn = self.tool_fns["databricks_execute_sql_batch"]
+        result = fn(warehouse_id="wh-1", statements='["SELECT 1", "SELECT 2"]', catalog="cat")
+
+        assert self.client.statement_execution.execute_statement.call_count == 2
+        for call in self.client.statement_execution.execute_statement.call_args_list:
+            assert call[1]["warehouse_id"] == "wh-1"
+            assert call[1]["catalog"] == "cat"
+        parsed = json.loads(result)
+        assert parsed["count"] == 2
+        assert [r["statement"] for r in parsed["results"]] == ["SELECT 1", "SELECT 2"]
+        assert parsed["results"][1]["result"] == {"statement_id": "id-SELECT 2"}
+
+    def test_execute_sql_batch_partial_failure(self) -> None:
+        """A failing statement reports its error without failing the batch."""
+        def execute(statement, **kw):
+            if statement == "BAD":
+                raise RuntimeError("syntax error")
+            return SimpleNamespace(status="SUCCEEDED")
+
+        self.client.statement_execution.execute_statement.side_effect = execute
+        fn = self.tool_fns["databricks_execute_sql_batch"]
+        parsed = json.loads(fn(warehouse_id="wh-1", statements='["SELECT 1", "BAD"]'))
+
+        assert "result" in parsed["results"][0]
+        assert "syntax error" in parsed["results"][1]["error"]
+
+    def test_execute_sql_batch_rejects_invalid_input(self) -> None:
+        fn = self.tool_fns["databricks_execute_sql_batch"]
+        assert "Invalid JSON" in fn(warehouse_id="wh-1", statements="SELECT 1")
+        assert "non-empty JSON array" in fn(warehouse_id="wh-1", statements="[]")
+        too_many = json.dumps([f"SELECT {i}" for i in range(11)])
+        assert "At most 10" in fn(warehouse_id="wh-1", statements=too_many)
+        self.client.statement_execution.execute_statement.assert_not_called()
 
     def test_get_statement_status(self) -> None:
         mock_result = SimpleNamespace(status="RUNNING")
         self.client.statement_execution.get_statement.return_value = mock_result
-        fn = _get_tool_fn(self.mcp, "databricks_get_statement_status")
-        result = fn(statement_id="stmt-1")
+        fn = self.tool_fns["databricks_get_statement_status"]
+        fn(statement_id="stmt-1")
+        self.client.statement_execution.get_statement.assert_called_once_with("stmt-1")
+
+    def test_wait_for_statement_polls_until_terminal(self) -> None:
+        """Polling stops at the first terminal state, with escalating delays."""
+        self.client.statement_execution.get_statement.side_effect = [
+            SimpleNamespace(status=SimpleNamespace(state="PENDING")),
+            SimpleNamespace(status=SimpleNamespace(state="RUNNING")),
+            SimpleNamespace(status=SimpleNamespace(state="SUCCEEDED")),
+        ]
+        fn = self.tool_fns["databricks_wait_for_statement"]
+        with patch("databricks_mcp.tools.sql.time.sleep") as mock_sleep:
+            result = fn(statement_id="stmt-1")
+
+        assert self.client.statement_execution.get_statement.call_count == 3
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.2, 0.2]
+        assert json.loads(result)["status"]["state"] == "SUCCEEDED"
+
+    def test_wait_for_statement_returns_latest_when_budget_exhausted(self) -> None:
+        self.client.statement_execution.get_statement.return_value = SimpleNamespace(
+            status=SimpleNamespace(state="RUNNING")
+        )
+        fn = self.tool_fns["databricks_wait_for_statement"]
+        with patch("databricks_mcp.tools.sql.time.sleep") as mock_sleep:
+            result = fn(statement_id="stmt-1", max_wait_seconds=0)
+
         self.client.statement_execution.get_statement.assert_called_once_with("stmt-1")
+        mock_sleep.assert_not_called()
+        assert json.loads(result)["status"]["state"] == "RUNNING"
+
+    def test_get_statement_result_chunk(self) -> None:
+        self.client.statement_execution.get_statement_result_chunk_n.return_value = SimpleNamespace(
+            chunk_index=1, data_array=[["2"]], next_chunk_index=2
+        )
+        fn = self.tool_fns["databricks_get_statement_result_chunk"]
+        result = json.loads(fn(statement_id="stmt-1", chunk_index=1))
+
+        self.client.statement_execution.get_statement_result_chunk_n.assert_called_once_with("stmt-1", 1)
+        assert result["data_array"] == [["2"]]
+        assert result["next_chunk_index"] == 2
 
     def test_cancel_statement(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_cancel_statement")
+        fn = self.tool_fns["databricks_cancel_statement"]
         result = fn(statement_id="stmt-1")
         self.client.statement_execution.cancel_execution.assert_called_once_with("stmt-1")
         assert "Cancellation requested" in result
@@ -235,37 +330,35 @@ class TestQueryTools:
     """Test saved SQL query operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_queries(self) -> None:
-        self.client.queries.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_queries")
-        result = fn()
+        self.client.queries.list.return_value = ()
+        fn = self.tool_fns["databricks_list_queries"]
+        fn()
         self.client.queries.list.assert_called_once()
 
     def test_create_query(self) -> None:
         mock_result = SimpleNamespace(id="q-1", display_name="my query")
         self.client.queries.create.return_value = mock_result
 
-        fn = _get_tool_fn(self.mcp, "databricks_create_query")
-        with patch("databricks.sdk.service.sql.CreateQueryRequestQuery") as MockQuery:
-            MockQuery.return_value = "query_obj"
-            result = fn(
-                name="my query",
-                query_text="SELECT * FROM t",
-                warehouse_id="wh-1",
-                description="desc",
-            )
-            MockQuery.assert_called_once_with(
+        fn = self.tool_fns["databricks_create_query"]
+        fn(
+            name="my query",
+            query_text="SELECT * FROM t",
+            warehouse_id="wh-1",
+            description="desc",
+        )
+        self.client.queries.create.assert_called_once_with(
+            query=CreateQueryRequestQuery(
                 display_name="my query",
                 query_text="SELECT * FROM t",
                 warehouse_id="wh-1",
                 description="desc",
-            )
-        self.client.queries.create.assert_called_once_with(query="query_obj")
+            ),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -276,25 +369,26 @@ class TestAlertTools:
     """Test SQL alert operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_alerts(self) -> None:
-        self.client.alerts.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_alerts")
-        result = fn()
+        self.client.alerts.list.return_value = ()
+        fn = self.tool_fns["databricks_list_alerts"]
+        fn()
         self.client.alerts.list.assert_called_once()
 
     def test_create_alert(self) -> None:
         mock_result = SimpleNamespace(id="alert-1", name="my alert")
         self.client.alerts.create.return_value = mock_result
 
-        fn = _get_tool_fn(self.mcp, "databricks_create_alert")
-        result = fn(name="my alert", query_id="q-1", condition="value > 100")
+        fn = self.tool_fns["databricks_create_alert"]
+        fn(name="my alert", query_id="q-1", condition="value > 100")
         # The condition parameter is described but not passed to the SDK in the current impl
-        self.client.alerts.create.assert_called_once_with(name="my alert", query_id="q-1")
+        self.client.alerts.create.assert_called_once_with(
+            alert=CreateAlertRequestAlert(display_name="my alert", query_id="q-1"),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -305,57 +399,37 @@ class TestQueryHistoryTools:
     """Test query history listing."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_query_history_no_filter(self) -> None:
-        mock_result = SimpleNamespace(res=[])
-        self.client.query_history.list.return_value = mock_result
-
-        fn = _get_tool_fn(self.mcp, "databricks_list_query_history")
-        # ListQueryHistoryRequest may not exist in all SDK versions; create=True
-        # allows the patch to succeed even if the attribute is missing.
-        with patch("databricks.sdk.service.sql.ListQueryHistoryRequest", create=True) as MockReq, \
-             patch("databricks.sdk.service.sql.QueryFilter"):
-            MockReq.return_value = "request_obj"
-            result = fn()
-            # max_results defaults to 25
-            MockReq.assert_called_once_with(max_results=25)
-        self.client.query_history.list.assert_called_once_with("request_obj")
+        self.client.query_history.list.return_value = _EMPTY_HISTORY
+
+        fn = self.tool_fns["databricks_list_query_history"]
+        fn()
+        # max_results defaults to 25
+        self.client.query_history.list.assert_called_once_with(max_results=25)
 
     def test_list_query_history_with_warehouse(self) -> None:
-        mock_result = SimpleNamespace(res=[])
-        self.client.query_history.list.return_value = mock_result
-
-        fn = _get_tool_fn(self.mcp, "databricks_list_query_history")
-        with patch("databricks.sdk.service.sql.ListQueryHistoryRequest", create=True) as MockReq, \
-             patch("databricks.sdk.service.sql.QueryFilter") as MockFilter:
-            MockReq.return_value = "request_obj"
-            MockFilter.return_value = "filter_obj"
-            result = fn(warehouse_id="wh-1", max_results=10)
-            MockFilter.assert_called_once_with(warehouse_ids=["wh-1"])
-            MockReq.assert_called_once_with(filter_by="filter_obj", max_results=10)
+        self.client.query_history.list.return_value = _EMPTY_HISTORY
+
+        fn = self.tool_fns["databricks_list_query_history"]
+        fn(warehouse_id="wh-1", max_results=10)
+        self.client.query_history.list.assert_called_once_with(
+            filter_by=QueryFilter(warehouse_ids=["wh-1"]), max_results=10
+        )
 
     def test_list_query_history_max_results_capped(self) -> None:
         """max_results is capped at 25 even if a higher value is passed."""
-        mock_result = SimpleNamespace(res=[])
-        self.client.query_history.list.return_value = mock_result
+        self.client.query_history.list.return_value = _EMPTY_HISTORY
 
-        fn = _get_tool_fn(self.mcp, "databricks_list_query_history")
-        with patch("databricks.sdk.service.sql.ListQueryHistoryRequest", create=True) as MockReq, \
-             patch("databricks.sdk.service.sql.QueryFilter"):
-            MockReq.return_value = "request_obj"
-            result = fn(max_results=100)
-            MockReq.assert_called_once_with(max_results=25)
+        fn = self.tool_fns["databricks_list_query_history"]
+        fn(max_results=100)
+        self.client.query_history.list.assert_called_once_with(max_results=25)
 
     def test_list_query_history_error(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_list_query_history")
-        with patch("databricks.sdk.service.sql.ListQueryHistoryRequest", create=True) as MockReq, \
-             patch("databricks.sdk.service.sql.QueryFilter"):
-            MockReq.return_value = "request_obj"
-            self.client.query_history.list.side_effect = RuntimeError("forbidden")
-            result = fn()
-        assert "RuntimeError" in result
-        assert "forbidden" in result
+        fn = self.tool_fns["databricks_list_query_history"]
+        self.client.query_history.list.side_effect = RuntimeError("forbidden")
+        result = fn()
+        assert result == "RuntimeError: forbidden"
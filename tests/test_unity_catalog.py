@@ -6,11 +6,13 @@ and error handling (format_error return).
 """
 
 import json
+from collections.abc import Callable
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from databricks.sdk.service.catalog import VolumeType
 from mcp.server.fastmcp import FastMCP
 
 from databricks_mcp.tools.unity_catalog import register_tools
@@ -20,57 +22,73 @@ from databricks_mcp.tools.unity_catalog import register_tools
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _get_tool_fn(mcp: FastMCP, name: str):
-    """Retrieve a registered tool's underlying function by name."""
-    tool = mcp._tool_manager.get_tool(name)
-    assert tool is not None, f"Tool '{name}' not found in registered tools"
-    return tool.fn
+def _tool_fns(mcp: FastMCP) -> dict[str, Callable[..., str]]:
+    """Map each registered tool name to its underlying function."""
+    return {t.name: t.fn for t in mcp._tool_manager.list_tools()}
 
 
-def _tool_names(mcp: FastMCP) -> set[str]:
-    """Return the set of all registered tool names."""
-    return {t.name for t in mcp._tool_manager.list_tools()}
+@pytest.fixture(scope="module")
+def uc_mcp() -> FastMCP:
+    """A FastMCP instance with the Unity Catalog tools registered once per module.
+
+    Tools resolve ``get_workspace_client`` when called, not when registered,
+    so each test's ``patched_client`` still applies to the shared instance.
+    """
+    mcp = FastMCP("test-databricks")
+    register_tools(mcp)
+    return mcp
+
+
+@pytest.fixture(scope="module")
+def tool_fns(uc_mcp: FastMCP) -> dict[str, Callable[..., str]]:
+    return _tool_fns(uc_mcp)
+
+
+@pytest.fixture(scope="module")
+def tool_names(tool_fns: dict[str, Callable[..., str]]) -> frozenset[str]:
+    """Names of all registered tools."""
+    return frozenset(tool_fns)
 
 
 # ---------------------------------------------------------------------------
 # Registration
 # ---------------------------------------------------------------------------
 
+_EXPECTED_TOOLS = frozenset({
+    # Catalogs
+    "databricks_list_catalogs",
+    "databricks_get_catalog",
+    "databricks_create_catalog",
+    "databricks_delete_catalog",
+    # Schemas
+    "databricks_list_schemas",
+    "databricks_get_schema",
+    "databricks_create_schema",
+    "databricks_delete_schema",
+    # Tables
+    "databricks_list_tables",
+    "databricks_get_table",
+    "databricks_get_tables_bulk",
+    "databricks_delete_table",
+    # Volumes
+    "databricks_list_volumes",
+    "databricks_create_volume",
+    "databricks_delete_volume",
+    # Functions
+    "databricks_list_functions",
+    "databricks_get_function",
+    "databricks_delete_function",
+    # Registered Models
+    "databricks_list_registered_models",
+    "databricks_get_registered_model",
+})
+
+
 class TestRegistration:
     """Verify register_tools() adds all expected tools."""
 
-    def test_all_tools_registered(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        names = _tool_names(mcp)
-
-        expected = {
-            # Catalogs
-            "databricks_list_catalogs",
-            "databricks_get_catalog",
-            "databricks_create_catalog",
-            "databricks_delete_catalog",
-            # Schemas
-            "databricks_list_schemas",
-            "databricks_get_schema",
-            "databricks_create_schema",
-            "databricks_delete_schema",
-            # Tables
-            "databricks_list_tables",
-            "databricks_get_table",
-            "databricks_delete_table",
-            # Volumes
-            "databricks_list_volumes",
-            "databricks_create_volume",
-            "databricks_delete_volume",
-            # Functions
-            "databricks_list_functions",
-            "databricks_get_function",
-            "databricks_delete_function",
-            # Registered Models
-            "databricks_list_registered_models",
-            "databricks_get_registered_model",
-        }
-        assert expected.issubset(names), f"Missing tools: {expected - names}"
+    def test_all_tools_registered(self, tool_names: frozenset[str]) -> None:
+        assert _EXPECTED_TOOLS <= tool_names, f"Missing tools: {_EXPECTED_TOOLS - tool_names}"
 
 
 # ---------------------------------------------------------------------------
@@ -81,24 +99,22 @@ class TestCatalogTools:
     """Test catalog CRUD operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_catalogs(self) -> None:
-        self.client.catalogs.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_catalogs")
+        self.client.catalogs.list.return_value = ()
+        fn = self.tool_fns["databricks_list_catalogs"]
         result = fn()
-        self.client.catalogs.list.assert_called_once()
+        self.client.catalogs.list.assert_called_once_with(max_results=100)
         assert isinstance(result, str)
-        parsed = json.loads(result)
-        assert parsed == []
+        assert result == "[]"
 
     def test_get_catalog(self) -> None:
         mock_catalog = SimpleNamespace(name="my_catalog", owner="admin")
         self.client.catalogs.get.return_value = mock_catalog
-        fn = _get_tool_fn(self.mcp, "databricks_get_catalog")
+        fn = self.tool_fns["databricks_get_catalog"]
         result = fn(name="my_catalog")
         self.client.catalogs.get.assert_called_once_with("my_catalog")
         assert isinstance(result, str)
@@ -108,41 +124,28 @@ class TestCatalogTools:
     def test_create_catalog(self) -> None:
         mock_result = SimpleNamespace(name="new_cat", owner="admin")
         self.client.catalogs.create.return_value = mock_result
-        fn = _get_tool_fn(self.mcp, "databricks_create_catalog")
-        result = fn(name="new_cat", comment="test catalog")
+        fn = self.tool_fns["databricks_create_catalog"]
+        fn(name="new_cat", comment="test catalog")
         self.client.catalogs.create.assert_called_once_with(name="new_cat", comment="test catalog")
 
     def test_create_catalog_default_comment(self) -> None:
         mock_result = SimpleNamespace(name="cat")
         self.client.catalogs.create.return_value = mock_result
-        fn = _get_tool_fn(self.mcp, "databricks_create_catalog")
-        result = fn(name="cat")
+        fn = self.tool_fns["databricks_create_catalog"]
+        fn(name="cat")
         self.client.catalogs.create.assert_called_once_with(name="cat", comment="")
 
-    def test_delete_catalog(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_delete_catalog")
-        result = fn(name="old_cat")
-        self.client.catalogs.delete.assert_called_once_with("old_cat", force=False)
-        assert "deleted successfully" in result
-
-    def test_delete_catalog_force(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_delete_catalog")
-        result = fn(name="old_cat", force=True)
-        self.client.catalogs.delete.assert_called_once_with("old_cat", force=True)
-        assert "deleted successfully" in result
-
     def test_list_catalogs_error(self) -> None:
         self.client.catalogs.list.side_effect = RuntimeError("connection failed")
-        fn = _get_tool_fn(self.mcp, "databricks_list_catalogs")
+        fn = self.tool_fns["databricks_list_catalogs"]
         result = fn()
-        assert "RuntimeError" in result
-        assert "connection failed" in result
+        assert result == "RuntimeError: connection failed"
 
     def test_get_catalog_error_with_error_code(self) -> None:
         err = RuntimeError("not found")
         err.error_code = "RESOURCE_DOES_NOT_EXIST"  # type: ignore[attr-defined]
         self.client.catalogs.get.side_effect = err
-        fn = _get_tool_fn(self.mcp, "databricks_get_catalog")
+        fn = self.tool_fns["databricks_get_catalog"]
         result = fn(name="bad")
         assert "RESOURCE_DOES_NOT_EXIST" in result
 
@@ -155,44 +158,37 @@ class TestSchemaTools:
     """Test schema CRUD operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_schemas(self) -> None:
-        self.client.schemas.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_schemas")
-        result = fn(catalog_name="my_catalog")
-        self.client.schemas.list.assert_called_once_with(catalog_name="my_catalog")
+        self.client.schemas.list.return_value = ()
+        fn = self.tool_fns["databricks_list_schemas"]
+        fn(catalog_name="my_catalog")
+        self.client.schemas.list.assert_called_once_with(catalog_name="my_catalog", max_results=100)
 
     def test_get_schema(self) -> None:
         mock_schema = SimpleNamespace(name="my_schema", catalog_name="cat")
         self.client.schemas.get.return_value = mock_schema
-        fn = _get_tool_fn(self.mcp, "databricks_get_schema")
-        result = fn(full_name="cat.schema")
+        fn = self.tool_fns["databricks_get_schema"]
+        fn(full_name="cat.schema")
         self.client.schemas.get.assert_called_once_with("cat.schema")
 
     def test_create_schema(self) -> None:
         mock_result = SimpleNamespace(name="new_schema", catalog_name="cat")
         self.client.schemas.create.return_value = mock_result
-        fn = _get_tool_fn(self.mcp, "databricks_create_schema")
-        result = fn(name="new_schema", catalog_name="cat", comment="desc")
+        fn = self.tool_fns["databricks_create_schema"]
+        fn(name="new_schema", catalog_name="cat", comment="desc")
         self.client.schemas.create.assert_called_once_with(
             name="new_schema", catalog_name="cat", comment="desc"
         )
 
-    def test_delete_schema(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_delete_schema")
-        result = fn(full_name="cat.old_schema")
-        self.client.schemas.delete.assert_called_once_with("cat.old_schema")
-        assert "deleted successfully" in result
-
     def test_list_schemas_error(self) -> None:
         self.client.schemas.list.side_effect = ValueError("bad catalog")
-        fn = _get_tool_fn(self.mcp, "databricks_list_schemas")
+        fn = self.tool_fns["databricks_list_schemas"]
         result = fn(catalog_name="bad")
-        assert "ValueError" in result
+        assert result == "ValueError: bad catalog"
 
 
 # ---------------------------------------------------------------------------
@@ -203,29 +199,46 @@ class TestTableTools:
     """Test table list, get, and delete operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_tables(self) -> None:
-        self.client.tables.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_tables")
-        result = fn(catalog_name="cat", schema_name="sch")
-        self.client.tables.list.assert_called_once_with(catalog_name="cat", schema_name="sch")
+        self.client.tables.list.return_value = ()
+        fn = self.tool_fns["databricks_list_tables"]
+        fn(catalog_name="cat", schema_name="sch")
+        self.client.tables.list.assert_called_once_with(
+            catalog_name="cat", schema_name="sch", max_results=100
+        )
 
     def test_get_table(self) -> None:
         mock_table = SimpleNamespace(name="tbl", table_type="MANAGED")
         self.client.tables.get.return_value = mock_table
-        fn = _get_tool_fn(self.mcp, "databricks_get_table")
-        result = fn(full_name="cat.sch.tbl")
+        fn = self.tool_fns["databricks_get_table"]
+        fn(full_name="cat.sch.tbl")
         self.client.tables.get.assert_called_once_with("cat.sch.tbl")
 
-    def test_delete_table(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_delete_table")
-        result = fn(full_name="cat.sch.tbl")
-        self.client.tables.delete.assert_called_once_with("cat.sch.tbl")
-        assert "deleted successfully" in result
+    def test_get_tables_bulk(self) -> None:
+        def get(full_name: str) -> SimpleNamespace:
+            if full_name == "cat.sch.missing":
+                raise RuntimeError("not found")
+            return SimpleNamespace(full_name=full_name)
+
+        self.client.tables.get.side_effect = get
+        fn = self.tool_fns["databricks_get_tables_bulk"]
+        parsed = json.loads(fn(full_names="cat.sch.a, cat.sch.missing,cat.sch.a"))
+
+        assert self.client.tables.get.call_count == 2
+        assert parsed["count"] == 2
+        assert parsed["tables"]["cat.sch.a"]["full_name"] == "cat.sch.a"
+        assert "not found" in parsed["tables"]["cat.sch.missing"]["error"]
+
+    def test_get_tables_bulk_rejects_invalid_input(self) -> None:
+        fn = self.tool_fns["databricks_get_tables_bulk"]
+        assert "at least one" in fn(full_names=" , ")
+        too_many = ",".join(f"cat.sch.t{i}" for i in range(21))
+        assert "At most 20" in fn(full_names=too_many)
+        self.client.tables.get.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -236,39 +249,37 @@ class TestVolumeTools:
     """Test volume list, create, and delete operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_volumes(self) -> None:
-        self.client.volumes.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_volumes")
-        result = fn(catalog_name="cat", schema_name="sch")
-        self.client.volumes.list.assert_called_once_with(catalog_name="cat", schema_name="sch")
+        self.client.volumes.list.return_value = ()
+        fn = self.tool_fns["databricks_list_volumes"]
+        fn(catalog_name="cat", schema_name="sch")
+        self.client.volumes.list.assert_called_once_with(
+            catalog_name="cat", schema_name="sch", max_results=100
+        )
 
     def test_create_volume(self) -> None:
         mock_result = SimpleNamespace(name="vol", catalog_name="cat", schema_name="sch")
         self.client.volumes.create.return_value = mock_result
-        fn = _get_tool_fn(self.mcp, "databricks_create_volume")
-
-        # Patch VolumeType since it's imported inside the function
-        with patch("databricks.sdk.service.catalog.VolumeType") as MockVolumeType:
-            MockVolumeType.return_value = "MANAGED"
-            result = fn(name="vol", catalog_name="cat", schema_name="sch")
-            self.client.volumes.create.assert_called_once_with(
-                name="vol",
-                catalog_name="cat",
-                schema_name="sch",
-                volume_type="MANAGED",
-                comment="",
-            )
-
-    def test_delete_volume(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_delete_volume")
-        result = fn(full_name="cat.sch.vol")
-        self.client.volumes.delete.assert_called_once_with("cat.sch.vol")
-        assert "deleted successfully" in result
+        fn = self.tool_fns["databricks_create_volume"]
+
+        fn(name="vol", catalog_name="cat", schema_name="sch")
+        self.client.volumes.create.assert_called_once_with(
+            name="vol",
+            catalog_name="cat",
+            schema_name="sch",
+            volume_type=VolumeType.MANAGED,
+            comment="",
+        )
+
+    def test_create_volume_invalid_type(self) -> None:
+        fn = self.tool_fns["databricks_create_volume"]
+        result = fn(name="vol", catalog_name="cat", schema_name="sch", volume_type="remote")
+        assert "Invalid volume_type 'remote'" in result
+        self.client.volumes.create.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -279,30 +290,25 @@ class TestFunctionTools:
     """Test UDF list, get, and delete operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_functions(self) -> None:
-        self.client.functions.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_functions")
-        result = fn(catalog_name="cat", schema_name="sch")
-        self.client.functions.list.assert_called_once_with(catalog_name="cat", schema_name="sch")
+        self.client.functions.list.return_value = ()
+        fn = self.tool_fns["databricks_list_functions"]
+        fn(catalog_name="cat", schema_name="sch")
+        self.client.functions.list.assert_called_once_with(
+            catalog_name="cat", schema_name="sch", max_results=100
+        )
 
     def test_get_function(self) -> None:
         mock_func = SimpleNamespace(name="my_func", catalog_name="cat")
         self.client.functions.get.return_value = mock_func
-        fn = _get_tool_fn(self.mcp, "databricks_get_function")
-        result = fn(full_name="cat.sch.my_func")
+        fn = self.tool_fns["databricks_get_function"]
+        fn(full_name="cat.sch.my_func")
         self.client.functions.get.assert_called_once_with("cat.sch.my_func")
 
-    def test_delete_function(self) -> None:
-        fn = _get_tool_fn(self.mcp, "databricks_delete_function")
-        result = fn(full_name="cat.sch.my_func")
-        self.client.functions.delete.assert_called_once_with("cat.sch.my_func")
-        assert "deleted successfully" in result
-
 
 # ---------------------------------------------------------------------------
 # Registered Model tools
@@ -312,42 +318,70 @@ class TestRegisteredModelTools:
     """Test registered model list and get operations."""
 
     @pytest.fixture(autouse=True)
-    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
-        register_tools(mcp)
-        self.mcp = mcp
+    def _bind(self, tool_fns: dict[str, Callable[..., str]], patched_client: MagicMock) -> None:
+        self.tool_fns = tool_fns
         self.client = patched_client
 
     def test_list_registered_models_no_filter(self) -> None:
-        self.client.registered_models.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_registered_models")
-        result = fn()
+        self.client.registered_models.list.return_value = ()
+        fn = self.tool_fns["databricks_list_registered_models"]
+        fn()
         # No kwargs when both catalog_name and schema_name are empty
-        self.client.registered_models.list.assert_called_once_with()
+        self.client.registered_models.list.assert_called_once_with(max_results=100)
 
     def test_list_registered_models_with_catalog(self) -> None:
-        self.client.registered_models.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_registered_models")
-        result = fn(catalog_name="cat")
-        self.client.registered_models.list.assert_called_once_with(catalog_name="cat")
+        self.client.registered_models.list.return_value = ()
+        fn = self.tool_fns["databricks_list_registered_models"]
+        fn(catalog_name="cat")
+        self.client.registered_models.list.assert_called_once_with(catalog_name="cat", max_results=100)
 
     def test_list_registered_models_with_catalog_and_schema(self) -> None:
-        self.client.registered_models.list.return_value = iter([])
-        fn = _get_tool_fn(self.mcp, "databricks_list_registered_models")
-        result = fn(catalog_name="cat", schema_name="sch")
+        self.client.registered_models.list.return_value = ()
+        fn = self.tool_fns["databricks_list_registered_models"]
+        fn(catalog_name="cat", schema_name="sch")
         self.client.registered_models.list.assert_called_once_with(
-            catalog_name="cat", schema_name="sch"
+            catalog_name="cat", schema_name="sch", max_results=100
         )
 
     def test_get_registered_model(self) -> None:
         mock_model = SimpleNamespace(name="my_model", owner="admin")
         self.client.registered_models.get.return_value = mock_model
-        fn = _get_tool_fn(self.mcp, "databricks_get_registered_model")
-        result = fn(full_name="cat.sch.my_model")
+        fn = self.tool_fns["databricks_get_registered_model"]
+        fn(full_name="cat.sch.my_model")
         self.client.registered_models.get.assert_called_once_with("cat.sch.my_model")
 
     def test_list_registered_models_error(self) -> None:
         self.client.registered_models.list.side_effect = ConnectionError("timeout")
-        fn = _get_tool_fn(self.mcp, "databricks_list_registered_models")
+        fn = self.tool_fns["databricks_list_registered_models"]
         result = fn()
-        assert "ConnectionError" in result
-        assert "timeout" in result
+        assert result == "ConnectionError: timeout"
+
+
+# ---------------------------------------------------------------------------
+# Delete tools
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "tool, service, kwargs, expected_args, expected_kwargs",
+    [
+        ("databricks_delete_catalog", "catalogs", {"name": "old_cat"}, ("old_cat",), {"force": False}),
+        ("databricks_delete_catalog", "catalogs", {"name": "old_cat", "force": True}, ("old_cat",), {"force": True}),
+        ("databricks_delete_schema", "schemas", {"full_name": "cat.old_schema"}, ("cat.old_schema",), {}),
+        ("databricks_delete_table", "tables", {"full_name": "cat.sch.tbl"}, ("cat.sch.tbl",), {}),
+        ("databricks_delete_volume", "volumes", {"full_name": "cat.sch.vol"}, ("cat.sch.vol",), {}),
+        ("databricks_delete_function", "functions", {"full_name": "cat.sch.my_func"}, ("cat.sch.my_func",), {}),
+    ],
+    ids=["catalog", "catalog_force", "schema", "table", "volume", "function"],
+)
+def test_delete_resource(
+    tool_fns: dict[str, Callable[..., str]],
+    patched_client: MagicMock,
+    tool: str,
+    service: str,
+    kwargs: dict,
+    expected_args: tuple,
+    expected_kwargs: dict,
+) -> None:
+    result = tool_fns[tool](**kwargs)
+    getattr(patched_client, service).delete.assert_called_once_with(*expected_args, **expected_kwargs)
+    assert "deleted successfully" in result
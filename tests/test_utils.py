@@ -1,14 +1,19 @@
 """Tests for databricks_mcp.utils — serialize, paginate, truncate_results, format_error, to_json."""
 
 import json
+from collections import OrderedDict, namedtuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, EnumMeta
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+from databricks.sdk.service.compute import AutoScale, ClusterDetails, State
+from databricks.sdk.service.iam import ComplexValue, User
 
 from databricks_mcp.utils import (
     format_error,
+    from_json,
     paginate,
     serialize,
     to_json,
@@ -20,26 +25,45 @@ from databricks_mcp.utils import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+Point = namedtuple("Point", ["x", "y"])
+
+
 class Color(Enum):
     RED = "red"
     GREEN = "green"
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     city: str
     zip_code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     name: str
     age: int
     address: Address | None = None
 
 
+@dataclass
+class Tag:
+    label: str
+
+
+@dataclass
+class Empty:
+    pass
+
+
+@dataclass
+class Team:
+    lead: Person
+    color: Color
+
+
 class PlainObject:
-    """A non-dataclass object with __dict__."""
+    """A non-dataclass object with __dict__; must stay unslotted to cover that branch."""
 
     def __init__(self, x: int, y: int) -> None:
         self.x = x
@@ -54,32 +78,35 @@ class PlainObject:
 class TestSerialize:
     """Verify serialize() handles the full spectrum of types."""
 
-    def test_none(self) -> None:
-        assert serialize(None) is None
-
-    def test_primitives(self) -> None:
-        assert serialize("hello") == "hello"
-        assert serialize(42) == 42
-        assert serialize(3.14) == 3.14
-        assert serialize(True) is True
-        assert serialize(False) is False
-
-    def test_dict(self) -> None:
-        result = serialize({"a": 1, "b": "two"})
-        assert result == {"a": 1, "b": "two"}
-
-    def test_nested_dict(self) -> None:
-        result = serialize({"outer": {"inner": 99}})
-        assert result == {"outer": {"inner": 99}}
-
-    def test_list(self) -> None:
-        result = serialize([1, "two", 3.0])
-        assert result == [1, "two", 3.0]
-
-    def test_tuple(self) -> None:
-        # Tuples are serialized as lists
-        result = serialize((1, 2, 3))
-        assert result == [1, 2, 3]
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, None),
+            ("hello", "hello"),
+            (42, 42),
+            (3.14, 3.14),
+            (True, True),
+            (False, False),
+            ({"a": 1, "b": "two"}, {"a": 1, "b": "two"}),
+            ({"outer": {"inner": 99}}, {"outer": {"inner": 99}}),
+            # None values inside dicts are kept; only dataclass/object filtering removes them
+            ({"key": None}, {"key": None}),
+            ([1, "two", 3.0], [1, "two", 3.0]),
+            # Tuples are serialized as lists
+            ((1, 2, 3), [1, 2, 3]),
+            (Color.RED, "red"),
+            (Color.GREEN, "green"),
+        ],
+        ids=repr,
+    )
+    def test_json_native_values(self, value: Any, expected: Any) -> None:
+        result = serialize(value)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    def test_container_subclasses(self) -> None:
+        assert serialize(OrderedDict(a=Color.RED)) == {"a": "red"}
+        assert serialize(Point(1, Color.GREEN)) == [1, "green"]
 
     def test_dataclass_simple(self) -> None:
         person = Person(name="Alice", age=30)
@@ -88,6 +115,10 @@ class TestSerialize:
         # address is None and should be excluded
         assert "address" not in result
 
+    def test_dataclass_one_and_zero_fields(self) -> None:
+        assert serialize(Tag(label="x")) == {"label": "x"}
+        assert serialize(Empty()) == {}
+
     def test_dataclass_nested(self) -> None:
         person = Person(name="Bob", age=25, address=Address(city="NYC", zip_code="10001"))
         result = serialize(person)
@@ -97,9 +128,19 @@ class TestSerialize:
             "address": {"city": "NYC", "zip_code": "10001"},
         }
 
-    def test_enum(self) -> None:
-        assert serialize(Color.RED) == "red"
-        assert serialize(Color.GREEN) == "green"
+    def test_enum_without_dataclass_wrapper(self) -> None:
+        """Bare SDK enums (str-valued) serialize to their wire value."""
+        assert serialize(State.RUNNING) == "RUNNING"
+        assert serialize([State.PENDING, None]) == ["PENDING", None]
+
+    def test_enum_with_custom_metaclass(self) -> None:
+        class Meta(EnumMeta):
+            pass
+
+        class Level(str, Enum, metaclass=Meta):
+            LOW = "low"
+
+        assert serialize(Level.LOW) == "low"
 
     def test_object_with_dict(self) -> None:
         obj = PlainObject(x=10, y=20)
@@ -115,6 +156,34 @@ class TestSerialize:
         result = serialize(obj)
         assert "z" not in result
 
+    def test_nested_dataclass_none_fields_omitted(self) -> None:
+        """None fields are dropped at every level, not just the top one."""
+        team = Team(lead=Person(name="Cy", age=40), color=Color.GREEN)
+        assert serialize(team) == {"lead": {"name": "Cy", "age": 40}, "color": "green"}
+
+    def test_sdk_dataclass(self) -> None:
+        cluster = ClusterDetails(cluster_id="c-1", autoscale=AutoScale(max_workers=4), state=State.RUNNING)
+        assert serialize(cluster) == {
+            "cluster_id": "c-1",
+            "autoscale": {"max_workers": 4},
+            "state": "RUNNING",
+        }
+
+    def test_sdk_dataclass_keeps_python_field_names(self) -> None:
+        """Keys are field names, not the camelCase wire names as_dict() would emit."""
+        user = User(
+            user_name="a@example.com",
+            display_name="A",
+            emails=[ComplexValue(value="a@example.com")],
+            groups=[],
+        )
+        assert serialize(user) == {
+            "user_name": "a@example.com",
+            "display_name": "A",
+            "emails": [{"value": "a@example.com"}],
+            "groups": [],
+        }
+
     def test_list_of_dataclasses(self) -> None:
         people = [Person(name="A", age=1), Person(name="B", age=2)]
         result = serialize(people)
@@ -130,11 +199,6 @@ class TestSerialize:
         result = serialize(42 + 3j)  # complex number
         assert result == str(42 + 3j)
 
-    def test_dict_with_none_values_kept(self) -> None:
-        """None values inside dicts are serialized (only dataclass/object filtering removes them)."""
-        result = serialize({"key": None})
-        assert result == {"key": None}
-
 
 # ---------------------------------------------------------------------------
 # paginate()
@@ -174,6 +238,17 @@ class TestPaginate:
         result = paginate(iter([1, 2, 3]), max_items=0)
         assert result == []
 
+    def test_negative_max_items(self) -> None:
+        """A negative max_items behaves like zero rather than raising."""
+        result = paginate(iter([1, 2, 3]), max_items=-1)
+        assert result == []
+
+    def test_stops_without_consuming_extra_item(self) -> None:
+        """paginate() must not pull past max_items (that would fetch another page)."""
+        items = iter(range(10))
+        paginate(items, max_items=3)
+        assert next(items) == 3
+
 
 # ---------------------------------------------------------------------------
 # truncate_results()
@@ -186,6 +261,7 @@ class TestTruncateResults:
         items = [1, 2, 3]
         result = truncate_results(items, max_items=50)
         assert result == {"items": [1, 2, 3], "count": 3, "truncated": False}
+        assert result["items"] is items
 
     def test_at_limit(self) -> None:
         items = list(range(50))
@@ -248,6 +324,30 @@ class TestFormatError:
         assert result == "MyCustomError: oops"
 
 
+# ---------------------------------------------------------------------------
+# from_json()
+# ---------------------------------------------------------------------------
+
+class TestFromJson:
+    """Verify from_json() matches json.loads() semantics."""
+
+    def test_object(self) -> None:
+        assert from_json('{"a": [1, 2.5, "x", null, true]}') == {"a": [1, 2.5, "x", None, True]}
+
+    def test_stdlib_fallback_without_orjson(self) -> None:
+        with patch("databricks_mcp.utils.orjson", None):
+            assert from_json("[1, 2]") == [1, 2]
+
+    def test_large_int_and_nan_fall_back_to_stdlib(self) -> None:
+        assert from_json(str(2**70)) == 2**70
+        result = from_json("[NaN]")
+        assert result[0] != result[0]
+
+    def test_invalid_json_raises_json_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            from_json("{not json")
+
+
 # ---------------------------------------------------------------------------
 # to_json()
 # ---------------------------------------------------------------------------
@@ -286,3 +386,52 @@ class TestToJson:
         parsed = json.loads(result)
         # The object should have been stringified
         assert isinstance(parsed["date"], str)
+
+    def test_stdlib_fallback_without_orjson(self) -> None:
+        """With orjson unavailable, the stdlib encoder produces the same JSON."""
+        payload = {"name": "Alice", "tags": ["a", "b"], "nested": {"n": 1.5}}
+        with patch("databricks_mcp.utils.orjson", None):
+            fallback = to_json(payload)
+        assert json.loads(fallback) == json.loads(to_json(payload))
+
+    def test_non_ascii_identical_on_both_encoders(self) -> None:
+        payload = {"owner": "Zoë", "comment": "日本語"}
+        with patch("databricks_mcp.utils.orjson", None):
+            fallback = to_json(payload)
+        assert fallback == to_json(payload)
+        assert "Zoë" in fallback
+
+    def test_large_int_falls_back_to_stdlib(self) -> None:
+        """Integers orjson cannot encode still serialize."""
+        result = to_json({"big": 2**70})
+        assert json.loads(result) == {"big": 2**70}
+
+    def test_native_values_skip_serialize(self) -> None:
+        """Already-serialized results are encoded without another serialize() walk."""
+        payload = {"items": [{"name": "a"}], "count": 1}
+        with patch("databricks_mcp.utils.serialize", wraps=serialize) as spy:
+            assert json.loads(to_json(payload)) == payload
+        spy.assert_not_called()
+
+    def test_nested_dataclass_in_dict(self) -> None:
+        result = json.loads(to_json({"people": [Person(name="A", age=1)], "color": Color.RED}))
+        assert result == {"people": [{"name": "A", "age": 1}], "color": "red"}
+
+    def test_unencodable_value_attribute_falls_back_to_str(self) -> None:
+        """An object whose .value is itself unencodable is stringified, not recursed into forever."""
+        class Handle:
+            @property
+            def value(self) -> "Handle":
+                return Handle()
+
+            def __str__(self) -> str:
+                return "handle"
+
+        assert json.loads(to_json({"handle": Handle()})) == {"handle": "handle"}
+        with patch("databricks_mcp.utils.orjson", None):
+            assert json.loads(to_json({"handle": Handle()})) == {"handle": "handle"}
+
+    def test_non_string_keys_match_stdlib(self) -> None:
+        """Integer keys become strings, as json.dumps would produce."""
+        payload = {1: "a", 2: {3: "b"}}
+        assert to_json(payload) == json.dumps(payload, indent=2)
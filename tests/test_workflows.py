@@ -0,0 +1,301 @@
+"""Tests for databricks_mcp.tools.workflows — composite workflow tools.
+
+Tests cover the workspace status report, markdown query results, and table
+preview including the remembered-warehouse fallback and the concurrent
+metadata fetch.
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from databricks.sdk.errors import NotFound, PermissionDenied
+from databricks.sdk.service.compute import State as ComputeState
+from databricks.sdk.service.serving import EndpointStateReady
+from databricks.sdk.service.sql import State
+from mcp.server.fastmcp import FastMCP
+
+from databricks_mcp.tools.workflows import register_tools
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _tool_fns(mcp: FastMCP) -> dict[str, Callable[..., str]]:
+    """Map each registered tool name to its underlying function."""
+    return {t.name: t.fn for t in mcp._tool_manager.list_tools()}
+
+
+def _statement_response(*rows: list[str]) -> SimpleNamespace:
+    """A minimal execute_statement response with an ``id`` column."""
+    return SimpleNamespace(
+        result=SimpleNamespace(data_array=list(rows)),
+        manifest=SimpleNamespace(schema=SimpleNamespace(columns=[SimpleNamespace(name="id")])),
+    )
+
+
+# ---------------------------------------------------------------------------
+# databricks_workspace_status
+# ---------------------------------------------------------------------------
+
+class TestWorkspaceStatus:
+    """Test the combined workspace health report."""
+
+    @pytest.fixture(autouse=True)
+    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
+        # Registered per test: the last report is kept in the closure
+        register_tools(mcp)
+        self.fn = _tool_fns(mcp)["databricks_workspace_status"]
+        self.client = patched_client
+        self.client.current_user.me.return_value = SimpleNamespace(user_name="me@example.com")
+        for service in ("clusters", "warehouses", "jobs", "serving_endpoints", "catalogs"):
+            getattr(self.client, service).list.return_value = ()
+
+    def test_report_has_every_probe(self) -> None:
+        result = json.loads(self.fn())
+
+        assert result == {
+            "auth": {"status": "ok", "user": "me@example.com"},
+            "clusters": {"total": 0, "running": 0, "terminated": 0},
+            "sql_warehouses": {"total": 0, "running": 0},
+            "jobs": {"total": 0},
+            "serving_endpoints": {"total": 0, "ready": 0},
+            "catalogs": {"total": 0},
+        }
+
+    def test_probes_run_concurrently(self) -> None:
+        # Each listing waits for the other; run one after another, both would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def list_after_barrier() -> tuple:
+            barrier.wait()
+            return ()
+
+        self.client.clusters.list.side_effect = list_after_barrier
+        self.client.warehouses.list.side_effect = list_after_barrier
+
+        result = json.loads(self.fn())
+
+        assert result["clusters"]["total"] == 0
+        assert result["sql_warehouses"]["total"] == 0
+
+    def test_failing_probe_does_not_affect_others(self) -> None:
+        self.client.jobs.list.side_effect = RuntimeError("jobs down")
+        self.client.current_user.me.side_effect = RuntimeError("bad token")
+
+        result = json.loads(self.fn())
+
+        assert result["jobs"] == {"status": "unavailable"}
+        assert result["auth"] == {"status": "error", "error": "bad token"}
+        assert result["catalogs"] == {"total": 0}
+
+    def test_ttl_reuses_recent_report(self) -> None:
+        with patch("databricks_mcp.tools.workflows.time.monotonic", return_value=100.0):
+            first = self.fn()
+        self.client.clusters.list.return_value = (SimpleNamespace(state="RUNNING"),)
+        with patch("databricks_mcp.tools.workflows.time.monotonic", return_value=109.0):
+            second = self.fn(ttl_seconds=10)
+
+        assert second == first
+        self.client.clusters.list.assert_called_once()
+
+    def test_ttl_expired_or_zero_recomputes(self) -> None:
+        with patch("databricks_mcp.tools.workflows.time.monotonic", return_value=100.0):
+            self.fn()
+        with patch("databricks_mcp.tools.workflows.time.monotonic", return_value=110.0):
+            self.fn(ttl_seconds=10)
+            self.fn()
+
+        assert self.client.clusters.list.call_count == 3
+
+    def test_jobs_and_catalogs_counted_up_to_cap(self) -> None:
+        jobs = iter([SimpleNamespace(job_id=i) for i in range(150)])
+        self.client.jobs.list.return_value = jobs
+        self.client.catalogs.list.return_value = iter([SimpleNamespace(name=str(i)) for i in range(80)])
+
+        result = json.loads(self.fn())
+
+        assert result["jobs"] == {"total": 100}
+        assert result["catalogs"] == {"total": 50}
+        # Counting stops at the cap without pulling further items (and pages)
+        assert next(jobs).job_id == 100
+
+    def test_state_counts(self) -> None:
+        self.client.clusters.list.return_value = (
+            SimpleNamespace(state=ComputeState.RUNNING),
+            SimpleNamespace(state=ComputeState.TERMINATED),
+            SimpleNamespace(state=None),
+        )
+        self.client.warehouses.list.return_value = (
+            SimpleNamespace(state=State.RUNNING),
+            SimpleNamespace(state=State.STOPPED),
+        )
+        self.client.serving_endpoints.list.return_value = (
+            SimpleNamespace(state=SimpleNamespace(ready=EndpointStateReady.READY)),
+            SimpleNamespace(state=SimpleNamespace(ready=EndpointStateReady.NOT_READY)),
+            SimpleNamespace(state=None),
+        )
+
+        result = json.loads(self.fn())
+
+        assert result["clusters"] == {"total": 3, "running": 1, "terminated": 2}
+        assert result["sql_warehouses"] == {"total": 2, "running": 1}
+        assert result["serving_endpoints"] == {"total": 3, "ready": 1}
+
+
+# ---------------------------------------------------------------------------
+# databricks_query_as_markdown
+# ---------------------------------------------------------------------------
+
+class TestQueryAsMarkdown:
+    """Test SQL results rendered as a markdown table."""
+
+    @pytest.fixture(autouse=True)
+    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
+        register_tools(mcp)
+        self.fn = _tool_fns(mcp)["databricks_query_as_markdown"]
+        self.client = patched_client
+
+    def test_table_and_row_count(self) -> None:
+        self.client.statement_execution.execute_statement.return_value = _statement_response(["1"], [None])
+
+        result = self.fn(warehouse_id="wh-1", sql="SELECT id FROM t")
+
+        assert result == "| id |\n| --- |\n| 1 |\n| NULL |\n\n*2 rows returned*"
+        kwargs = self.client.statement_execution.execute_statement.call_args.kwargs
+        assert kwargs["row_limit"] == 101
+
+    def test_rows_beyond_limit_truncated(self) -> None:
+        self.client.statement_execution.execute_statement.return_value = _statement_response(
+            *([str(i)] for i in range(101))
+        )
+
+        result = self.fn(warehouse_id="wh-1", sql="SELECT id FROM t")
+
+        table, meta = result.split("\n\n")
+        assert meta == "*More than 100 rows returned (showing first 100)*"
+        assert table.splitlines()[-1] == "| 99 |"
+        assert len(table.splitlines()) == 102
+
+    def test_no_rows(self) -> None:
+        self.client.statement_execution.execute_statement.return_value = _statement_response()
+        assert self.fn(warehouse_id="wh-1", sql="SELECT 1 WHERE false") == "Query returned no results."
+
+
+# ---------------------------------------------------------------------------
+# databricks_table_preview
+# ---------------------------------------------------------------------------
+
+class TestTablePreview:
+    """Test table preview, warehouse resolution, and the warehouse hint."""
+
+    @pytest.fixture(autouse=True)
+    def _register(self, mcp: FastMCP, patched_client: MagicMock) -> None:
+        # Registered per test: the remembered warehouse lives in the closure
+        register_tools(mcp)
+        self.fn = _tool_fns(mcp)["databricks_table_preview"]
+        self.client = patched_client
+        self.client.tables.get.return_value = SimpleNamespace(
+            columns=[SimpleNamespace(name="id", type_name=None, type_text="int")]
+        )
+        self.client.warehouses.list.return_value = (
+            SimpleNamespace(id="wh-stopped", state=State.STOPPED),
+            SimpleNamespace(id="wh-1", state=State.RUNNING),
+        )
+        self.client.statement_execution.execute_statement.return_value = _statement_response(["1"])
+
+    def test_preview_with_metadata(self) -> None:
+        result = json.loads(self.fn(table_name="c.s.t"))
+
+        assert result == {
+            "table_name": "c.s.t",
+            "columns": [{"name": "id", "type": "int"}],
+            "column_count": 1,
+            "sample_data": {"columns": ["id"], "rows": [["1"]], "row_count": 1},
+        }
+        self.client.tables.get.assert_called_once_with("c.s.t")
+        assert self.client.statement_execution.execute_statement.call_args.kwargs["warehouse_id"] == "wh-1"
+
+    def test_metadata_failure_keeps_sample(self) -> None:
+        self.client.tables.get.side_effect = RuntimeError("denied")
+        result = json.loads(self.fn(table_name="c.s.t", warehouse_id="wh-9"))
+
+        assert result["metadata"] == "Could not retrieve table metadata"
+        assert result["sample_data"]["rows"] == [["1"]]
+        self.client.warehouses.list.assert_not_called()
+
+    def test_running_warehouse_remembered(self) -> None:
+        self.fn(table_name="c.s.t")
+        self.fn(table_name="c.s.t")
+
+        self.client.warehouses.list.assert_called_once()
+        assert self.client.statement_execution.execute_statement.call_count == 2
+
+    def test_remembered_warehouse_expires(self) -> None:
+        with patch("databricks_mcp.tools.workflows.time.monotonic", return_value=100.0):
+            self.fn(table_name="c.s.t")
+        with patch("databricks_mcp.tools.workflows.time.monotonic", return_value=131.0):
+            self.fn(table_name="c.s.t")
+
+        assert self.client.warehouses.list.call_count == 2
+
+    def test_stopped_hint_retries_with_fresh_lookup(self) -> None:
+        self.fn(table_name="c.s.t")
+        self.client.statement_execution.execute_statement.side_effect = [
+            RuntimeError("warehouse stopped"),
+            _statement_response(["2"]),
+        ]
+        self.client.warehouses.get.return_value = SimpleNamespace(id="wh-1", state=State.STOPPED)
+        self.client.warehouses.list.return_value = (SimpleNamespace(id="wh-2", state=State.RUNNING),)
+
+        result = json.loads(self.fn(table_name="c.s.t"))
+
+        assert result["sample_data"]["rows"] == [["2"]]
+        self.client.warehouses.get.assert_called_once_with("wh-1")
+        assert self.client.statement_execution.execute_statement.call_args.kwargs["warehouse_id"] == "wh-2"
+
+    def test_deleted_hint_retries_with_fresh_lookup(self) -> None:
+        self.fn(table_name="c.s.t")
+        self.client.statement_execution.execute_statement.side_effect = [
+            RuntimeError("warehouse gone"),
+            _statement_response(["2"]),
+        ]
+        self.client.warehouses.get.side_effect = NotFound("no such warehouse")
+
+        result = json.loads(self.fn(table_name="c.s.t"))
+
+        assert result["sample_data"]["rows"] == [["2"]]
+        assert self.client.warehouses.list.call_count == 2
+
+    def test_failed_hint_check_keeps_query_error(self) -> None:
+        self.fn(table_name="c.s.t")
+        self.client.statement_execution.execute_statement.side_effect = RuntimeError("TABLE_OR_VIEW_NOT_FOUND")
+        self.client.warehouses.get.side_effect = PermissionDenied("cannot view warehouse")
+        self.client.warehouses.list.return_value = ()
+
+        result = self.fn(table_name="c.s.missing")
+
+        assert result == "RuntimeError: TABLE_OR_VIEW_NOT_FOUND"
+
+    def test_query_error_on_running_hint_not_retried(self) -> None:
+        self.fn(table_name="c.s.t")
+        self.client.statement_execution.execute_statement.side_effect = RuntimeError("TABLE_OR_VIEW_NOT_FOUND")
+        self.client.warehouses.get.return_value = SimpleNamespace(id="wh-1", state=State.RUNNING)
+
+        result = self.fn(table_name="c.s.missing")
+
+        assert result == "RuntimeError: TABLE_OR_VIEW_NOT_FOUND"
+        assert self.client.statement_execution.execute_statement.call_count == 2
+        self.client.warehouses.list.assert_called_once()
+
+    def test_no_running_warehouse(self) -> None:
+        self.client.warehouses.list.return_value = (SimpleNamespace(id="wh-stopped", state=State.STOPPED),)
+        result = json.loads(self.fn(table_name="c.s.t"))
+
+        assert result["sample_data"] == "No running SQL warehouse found. Provide a warehouse_id or start one."
+        self.client.statement_execution.execute_statement.assert_not_called()